@@ -74,7 +74,7 @@ echo "Setting up OpsArtisan..."
 cd /opt/opsartisan
 python3 -m venv venv
 venv/bin/pip install --upgrade pip > /dev/null 2>&1
-venv/bin/pip install -e . > /dev/null 2>&1
+venv/bin/pip install -e . -c requirements.txt > /dev/null 2>&1
 
 cat > /usr/local/bin/opsartisan << 'WRAPPER'
 #!/bin/bash
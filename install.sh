@@ -17,11 +17,11 @@ NC='\033[0m' # No Color
 # Check if running in virtual environment
 if [[ -n "$VIRTUAL_ENV" ]]; then
     echo -e "${GREEN}Virtual environment detected: $VIRTUAL_ENV${NC}"
-    INSTALL_CMD="pip install -e ."
+    INSTALL_CMD="pip install -e . -c requirements.txt"
     BIN_PATH="$VIRTUAL_ENV/bin"
 else
     echo -e "${YELLOW}Not in a virtual environment - installing to user site${NC}"
-    INSTALL_CMD="pip install --user -e ."
+    INSTALL_CMD="pip install --user -e . -c requirements.txt"
     BIN_PATH="$HOME/.local/bin"
 fi
 
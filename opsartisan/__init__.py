@@ -2,18 +2,33 @@
 OpsArtisan - CLI-first assistant for sysadmins and DevOps engineers.
 """
 
-__version__ = "0.1.0"
+from opsartisan.config import __version__
+
 __author__ = "Your Name"
 __license__ = "MIT"
 
-from opsartisan.core.template_manager import TemplateManager
-from opsartisan.core.preset_manager import PresetManager
-from opsartisan.core.validator import Validator
-from opsartisan.core.prompter import InteractivePrompter
-
-__all__ = [
-    "TemplateManager",
-    "PresetManager",
-    "Validator",
-    "InteractivePrompter",
-]
+# Public classes are imported on first access, so importing the package
+# (e.g. to run the CLI) doesn't load every core module
+_EXPORTS = {
+    "TemplateManager": "opsartisan.core.template_manager",
+    "PresetManager": "opsartisan.core.preset_manager",
+    "Validator": "opsartisan.core.validator",
+    "InteractivePrompter": "opsartisan.core.prompter",
+}
+
+__all__ = ["__version__", *_EXPORTS]
+
+
+def __getattr__(name):
+    if name in _EXPORTS:
+        import importlib
+
+        obj = getattr(importlib.import_module(_EXPORTS[name]), name)
+        # Cache it so later lookups skip __getattr__ entirely
+        globals()[name] = obj
+        return obj
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return sorted({*globals(), *_EXPORTS})
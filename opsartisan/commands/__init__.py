@@ -0,0 +1 @@
+"""CLI command modules, imported on demand by opsartisan.cli."""
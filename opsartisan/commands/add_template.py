@@ -0,0 +1,60 @@
+"""Command for adding a template directory to user templates."""
+
+import sys
+from pathlib import Path
+import click
+
+
+@click.command()
+@click.argument('path', type=click.Path(exists=True))
+@click.option(
+    '--link',
+    is_flag=True,
+    help='Hard-link files instead of copying them (edits to the source then show up in the installed template)'
+)
+def add_template(path: str, link: bool):
+    """Add a template directory to user templates."""
+    from opsartisan.config import USER_TEMPLATES_DIR
+    from opsartisan.core.prompter import confirm
+    from opsartisan.core.template_manager import get_template_manager
+    from opsartisan.utils.file_utils import copy_directory
+    from opsartisan.utils.json_utils import load_json
+
+    source = Path(path)
+
+    # Load descriptor to get ID
+    try:
+        descriptor = load_json(source / "descriptor.json")
+    except FileNotFoundError:
+        click.echo(
+            "Error: No descriptor.json found in template directory.",
+            err=True
+        )
+        sys.exit(1)
+
+    template_id = descriptor.get('id')
+    if not template_id:
+        click.echo(
+            "Error: Template descriptor missing 'id' field.",
+            err=True
+        )
+        sys.exit(1)
+
+    # Copy to user templates
+    dest = USER_TEMPLATES_DIR / template_id
+
+    if dest.exists():
+        if not confirm(f"Template '{template_id}' already exists. Overwrite?"):
+            click.echo("Cancelled.")
+            return
+
+    # Copy directory; with --link, hard-link files when on the same filesystem
+    copy_directory(source, dest, overwrite=True, hardlink=link)
+    get_template_manager().register_template(descriptor, dest)
+
+    click.echo(
+        click.style(
+            f"✓ Added template '{template_id}' to {dest}",
+            fg='green'
+        )
+    )
@@ -0,0 +1,36 @@
+"""Shell completion commands."""
+
+import sys
+import click
+
+
+@click.group()
+def completion():
+    """Shell completion management."""
+    pass
+
+
+@completion.command('install')
+@click.argument('shell', type=click.Choice(['bash', 'zsh', 'fish']))
+def completion_install(shell: str):
+    """Install shell completion for bash, zsh, or fish."""
+    from opsartisan.utils.completion import CompletionManager
+
+    manager = CompletionManager()
+    success = manager.install_completion(shell)
+
+    if success:
+        click.echo(click.style(f"\n✓ Completion installed for {shell}", fg='green'))
+    else:
+        click.echo(click.style(f"\n✗ Failed to install completion", fg='red'))
+        sys.exit(1)
+
+
+@completion.command('show')
+@click.argument('shell', type=click.Choice(['bash', 'zsh', 'fish']))
+def completion_show(shell: str):
+    """Show completion script for manual installation."""
+    from opsartisan.utils.completion import CompletionManager
+
+    manager = CompletionManager()
+    manager.show_completion_script(shell)
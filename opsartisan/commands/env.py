@@ -0,0 +1,144 @@
+"""Environment configuration commands."""
+
+import sys
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+import click
+
+# Upper bound on environment files read concurrently
+_MAX_LOAD_WORKERS = 8
+
+
+@click.group()
+def env():
+    """Manage environment configurations."""
+    pass
+
+
+@env.command('create')
+@click.argument('template_id')
+@click.argument('env_name')
+@click.option('--from-preset', help='Base configuration from preset')
+@click.option('--out-dir', type=click.Path(), default='.', help='Output directory')
+def env_create(template_id: str, env_name: str, from_preset: Optional[str], out_dir: str):
+    """Create environment-specific configuration."""
+    from opsartisan.core.env_manager import EnvironmentManager
+    from opsartisan.core.template_manager import get_template_manager
+    from opsartisan.core.preset_manager import PresetManager
+
+    manager = get_template_manager()
+    template = manager.get_template(template_id)
+
+    if not template:
+        click.echo(f"Error: Template '{template_id}' not found.", err=True)
+        sys.exit(1)
+
+    # Get base configuration
+    if from_preset:
+        preset_data = PresetManager.get_preset(from_preset)
+        if not preset_data:
+            click.echo(f"Error: Preset '{from_preset}' not found.", err=True)
+            sys.exit(1)
+        base_config = preset_data['answers']
+    else:
+        from opsartisan.core.prompter import InteractivePrompter
+        prompter = InteractivePrompter()
+        base_config = prompter.prompt(template.get('prompts', []))
+
+    # Apply environment defaults
+    env_defaults = template.get('environment_defaults', {}).get(env_name, {})
+
+    click.echo(f"\nEnvironment-specific overrides for '{env_name}':")
+    for key, value in env_defaults.items():
+        click.echo(f"  {key}: {value}")
+
+    # Create environment manager and save
+    env_manager = EnvironmentManager(Path(out_dir))
+    env_file = env_manager.create_environment(env_name, base_config, env_defaults)
+
+    # Also create .env file
+    env_manager.create_env_file(env_name, {**base_config, **env_defaults})
+
+    click.echo(click.style(f"\n✓ Created environment '{env_name}'", fg='green'))
+    click.echo(f"Config: {env_file}")
+    click.echo(f"Env file: {Path(out_dir) / f'.env.{env_name}'}")
+
+
+@env.command('list')
+@click.option('--out-dir', type=click.Path(), default='.', help='Output directory')
+@click.option('--json', 'as_json', is_flag=True, help='Print the configurations as JSON')
+def env_list(out_dir: str, as_json: bool):
+    """List all environment configurations."""
+    from opsartisan.core.env_manager import EnvironmentManager
+
+    env_manager = EnvironmentManager(Path(out_dir))
+    environments = env_manager.list_environments()
+
+    if as_json:
+        from opsartisan.utils.json_utils import json_dumps
+
+        configs = _load_environments(env_manager, environments)
+        click.echo(json_dumps(dict(zip(environments, configs))))
+        return
+
+    if not environments:
+        click.echo("No environment configurations found.")
+        click.echo(f"\nCreate one with: opsartisan env create <template> <env-name>")
+        return
+
+    lines = [f"Available environments ({len(environments)}):\n"]
+    configs = _load_environments(env_manager, environments)
+    for env_name, config in zip(environments, configs):
+        lines.append(f"  {click.style(env_name, fg='green', bold=True)}")
+        if config:
+            lines.append(f"    {len(config)} configuration values")
+    click.echo('\n'.join(lines))
+
+
+@env.command('compare')
+@click.argument('template_id')
+@click.argument('environments', nargs=-1, required=True)
+@click.option('--out-dir', type=click.Path(), default='.', help='Output directory')
+def env_compare(template_id: str, environments: tuple, out_dir: str):
+    """Compare configurations across environments."""
+    from opsartisan.core.env_manager import EnvironmentManager
+    from opsartisan.core.template_manager import get_template_manager
+
+    manager = get_template_manager()
+    template = manager.get_template(template_id)
+
+    if not template:
+        click.echo(f"Error: Template '{template_id}' not found.", err=True)
+        sys.exit(1)
+
+    env_manager = EnvironmentManager(Path(out_dir))
+
+    # Load configurations for each environment
+    variants = {}
+    configs = _load_environments(env_manager, environments)
+    for env_name, config in zip(environments, configs):
+        if config:
+            variants[env_name] = config
+        else:
+            click.echo(f"Warning: Environment '{env_name}' not found", err=True)
+
+    if not variants:
+        click.echo("No environments to compare.", err=True)
+        sys.exit(1)
+
+    # Generate comparison report
+    report = env_manager.create_comparison_report(variants)
+    click.echo(report)
+
+
+def _load_environments(env_manager, env_names) -> List[Optional[Dict[str, Any]]]:
+    """Load several environment configs concurrently, in the given order."""
+    if len(env_names) <= 1:
+        return [env_manager.load_environment(name) for name in env_names]
+
+    from concurrent.futures import ThreadPoolExecutor
+
+    with ThreadPoolExecutor(
+            max_workers=min(_MAX_LOAD_WORKERS, len(env_names))
+    ) as executor:
+        return list(executor.map(env_manager.load_environment, env_names))
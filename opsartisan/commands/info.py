@@ -0,0 +1,71 @@
+"""Template information command."""
+
+import sys
+import click
+
+
+@click.command()
+@click.argument('template_id')
+def info(template_id: str):
+    """Show detailed information about a template."""
+    from opsartisan.core.template_manager import get_template_manager
+
+    manager = get_template_manager()
+    template = manager.get_template(template_id)
+
+    if not template:
+        click.echo(f"Error: Template '{template_id}' not found.", err=True)
+        sys.exit(1)
+
+    lines = [click.style(f"\n{template['title']}", fg='cyan', bold=True)]
+    lines.append(f"ID: {template['id']}")
+    lines.append(f"\n{template.get('description', 'No description')}\n")
+
+    # Category and tags
+    if template.get('category'):
+        lines.append(f"Category: {template['category']}")
+    if template.get('tags'):
+        lines.append(f"Tags: {', '.join(template['tags'])}")
+
+    # Dependencies
+    if template.get('dependencies'):
+        lines.append(f"\nDependencies:")
+        for dep in template['dependencies']:
+            lines.append(f"  - {dep}")
+
+    # Required tools
+    if template.get('required_tools'):
+        lines.append(f"\nRequired tools:")
+        for tool in template['required_tools']:
+            lines.append(f"  - {tool}")
+
+    # Prompts
+    if template.get('prompts'):
+        lines.append(f"\nConfiguration options ({len(template['prompts'])}):")
+        for prompt in template['prompts']:
+            prompt_type = prompt.get('type', 'string')
+            default = prompt.get('default', '')
+            lines.append(f"  - {prompt['label']} ({prompt_type})")
+            if default:
+                lines.append(f"    Default: {default}")
+
+    # Outputs
+    if template.get('outputs'):
+        lines.append(f"\nGenerated files ({len(template['outputs'])}):")
+        for output in template['outputs']:
+            lines.append(f"  - {output['path']}")
+
+    # Example usage
+    if template.get('example_usage'):
+        lines.append(f"\nExample usage:")
+        lines.append(f"  {template['example_usage']}")
+
+    # Next steps
+    if template.get('next_steps'):
+        lines.append(f"\nNext steps:")
+        for step in template['next_steps']:
+            lines.append(f"  • {step}")
+
+    lines.append(f"\nGenerate with: opsartisan new {template_id}")
+
+    click.echo('\n'.join(lines))
@@ -0,0 +1,91 @@
+"""Interactive template creation wizard."""
+
+import click
+
+from opsartisan.config import HAS_QUESTIONARY
+
+
+@click.command()
+def init():
+    """Interactive tutorial for creating your first template."""
+    from opsartisan.utils.json_utils import dump_json
+
+    click.echo(click.style(
+        "\n🎓 Welcome to OpsArtisan Template Creator!\n",
+        fg='cyan',
+        bold=True
+    ))
+    click.echo("This wizard will help you create a custom template.\n")
+
+    # Guide through template creation
+    if HAS_QUESTIONARY:
+        import questionary
+        template_id = questionary.text(
+            "Template ID (lowercase, no spaces):",
+            default="my-template"
+        ).ask()
+
+        title = questionary.text(
+            "Template title:",
+            default="My Custom Template"
+        ).ask()
+
+        description = questionary.text(
+            "Short description:"
+        ).ask()
+
+        category = questionary.select(
+            "Category:",
+            choices=["Infrastructure", "Configuration", "CI/CD", "Other"]
+        ).ask()
+    else:
+        template_id = input("Template ID (lowercase, no spaces): ") or "my-template"
+        title = input("Template title: ") or "My Custom Template"
+        description = input("Short description: ")
+        category = input("Category [Infrastructure]: ") or "Infrastructure"
+
+    # Create template structure
+    from opsartisan.config import USER_TEMPLATES_DIR
+    template_dir = USER_TEMPLATES_DIR / template_id
+    template_dir.mkdir(parents=True, exist_ok=True)
+    (template_dir / "templates").mkdir(exist_ok=True)
+
+    # Create descriptor
+    descriptor = {
+        "id": template_id,
+        "title": title,
+        "description": description,
+        "category": category,
+        "prompts": [
+            {
+                "id": "example_var",
+                "type": "string",
+                "label": "Example variable",
+                "default": "value"
+            }
+        ],
+        "outputs": [
+            {
+                "path": "output.txt",
+                "template": "example.j2"
+            }
+        ],
+        "next_steps": [
+            "Review the generated file",
+            "Customize as needed"
+        ]
+    }
+
+    dump_json(descriptor, template_dir / "descriptor.json")
+
+    # Create example template
+    (template_dir / "templates" / "example.j2").write_text(
+        "# Generated by {{ title }}\n"
+        "Example variable: {{ example_var }}\n"
+    )
+
+    click.echo(click.style(f"\n✓ Created template '{template_id}'!", fg='green'))
+    click.echo(f"Location: {template_dir}")
+    click.echo(f"\nTest it with: opsartisan new {template_id}")
+    click.echo(f"Edit descriptor: {template_dir / 'descriptor.json'}")
+    click.echo(f"Edit template: {template_dir / 'templates' / 'example.j2'}")
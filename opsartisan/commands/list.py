@@ -0,0 +1,86 @@
+"""Template listing command."""
+
+from typing import Optional
+import click
+
+
+@click.command('list')
+@click.option('--category', help='Filter by category')
+@click.option('--tag', help='Filter by tag')
+@click.option('--search', help='Search in title/description')
+@click.option('--json', 'as_json', is_flag=True, help='Print the templates as JSON')
+def list_templates(
+        category: Optional[str],
+        tag: Optional[str],
+        search: Optional[str],
+        as_json: bool
+):
+    """List available templates with optional filtering."""
+    from opsartisan.core.template_manager import get_template_manager
+
+    manager = get_template_manager()
+    templates = manager.list_templates()
+
+    if not templates and not as_json:
+        click.echo(
+            "No templates found. Add templates to ./templates/ "
+            "or ~/.opsartisan/templates/"
+        )
+        return
+
+    # Apply filters
+    if search:
+        templates = manager.search_templates(
+            search,
+            fields=('title', 'description')
+        )
+    if category:
+        templates = [t for t in templates if t.get('category') == category]
+    if tag:
+        templates = [t for t in templates if tag in t.get('tags', [])]
+
+    if as_json:
+        from opsartisan.utils.json_utils import json_dumps
+
+        click.echo(json_dumps([
+            {
+                **{k: v for k, v in t.items() if not k.startswith('_')},
+                'path': str(t['_path'])
+            }
+            for t in templates
+        ]))
+        return
+
+    if not templates:
+        click.echo("No templates match your criteria.")
+        return
+
+    lines = [f"Available templates ({len(templates)}):\n"]
+
+    # Sort by category (stable, so discovery order is kept within one) and
+    # print a header whenever the category changes
+    templates.sort(key=lambda t: t.get('category', 'Other'))
+    current_cat = None
+    for template in templates:
+        cat = template.get('category', 'Other')
+        if cat != current_cat:
+            lines.append(click.style(f"{cat}:", fg='cyan', bold=True))
+            current_cat = cat
+
+        lines.append(f"  {template['id']}")
+        lines.append(f"    {template.get('description', 'No description')}")
+
+        # Show tags if present
+        if template.get('tags'):
+            tags_str = ', '.join(template['tags'])
+            lines.append(click.style(f"    Tags: {tags_str}", fg='blue'))
+
+        # Show popularity hint if available
+        if template.get('usage_count'):
+            lines.append(click.style(
+                f"    Used {template['usage_count']} times",
+                fg='green'
+            ))
+        lines.append('')
+
+    click.echo('\n'.join(lines))
@@ -0,0 +1,235 @@
+"""Project generation command."""
+
+import sys
+from pathlib import Path
+from typing import Any, Dict, Optional, TYPE_CHECKING
+import click
+
+if TYPE_CHECKING:
+    from opsartisan.core.template_manager import TemplateManager
+
+
+@click.command()
+@click.argument('template_id')
+@click.option('--yes', is_flag=True, help='Use defaults without prompting')
+@click.option('--preset', help='Use saved preset')
+@click.option(
+    '--out-dir',
+    type=click.Path(),
+    default='.',
+    help='Output directory'
+)
+@click.option('--validate', is_flag=True, help='Run validators after generation')
+@click.option('--test', is_flag=True, help='Run tests after generation')
+@click.option(
+    '--merge',
+    type=click.Choice(['skip', 'overwrite', 'prompt']),
+    default='prompt',
+    help='Strategy for handling existing files'
+)
+@click.option('--async-validation', is_flag=True, help='Run validators in parallel')
+@click.option(
+    '--fail-fast',
+    is_flag=True,
+    help='Stop the remaining validators after the first failure (with --async-validation)'
+)
+# Kept for 'opsartisan new ... --debug', which worked before the group option
+@click.option('--debug', is_flag=True, hidden=True)
+def new(
+        template_id: str,
+        yes: bool,
+        preset: Optional[str],
+        out_dir: str,
+        validate: bool,
+        test: bool,
+        merge: str,
+        async_validation: bool,
+        fail_fast: bool,
+        debug: bool
+):
+    """Generate a new project from a template."""
+    from opsartisan.core.template_manager import get_template_manager
+    from opsartisan.core.prompter import InteractivePrompter, confirm
+
+    if debug:
+        click.get_current_context().ensure_object(dict)['debug'] = True
+
+    manager = get_template_manager()
+    template = manager.get_template(template_id)
+
+    if not template:
+        click.echo(f"Error: Template '{template_id}' not found.", err=True)
+        sys.exit(1)
+
+    _ensure_dependencies(manager, template, out_dir, yes)
+
+    click.echo(f"Creating {template['title']}")
+    click.echo(f"  {template.get('description', '')}\n")
+
+    # Get answers
+    if preset:
+        from opsartisan.core.preset_manager import PresetManager
+
+        preset_data = PresetManager.get_preset(preset)
+        if not preset_data:
+            click.echo(f"Error: Preset '{preset}' not found.", err=True)
+            sys.exit(1)
+        if preset_data['template_id'] != template_id:
+            click.echo(
+                f"Warning: Preset is for template "
+                f"'{preset_data['template_id']}', not '{template_id}'",
+                err=True
+            )
+        answers = preset_data['answers']
+    else:
+        prompter = InteractivePrompter()
+        answers = prompter.prompt(template.get('prompts', []), use_defaults=yes)
+
+    # Show summary
+    _echo_configuration(answers)
+
+    if not yes and not preset:
+        if not confirm("Proceed with generation?", default=True):
+            click.echo("Cancelled.")
+            return
+
+    _generate(
+        manager, template, answers, Path(out_dir), merge,
+        validate=validate, test=test, async_validation=async_validation,
+        fail_fast=fail_fast
+    )
+
+
+def _ensure_dependencies(
+        manager: 'TemplateManager',
+        template: Dict[str, Any],
+        out_dir: str,
+        yes: bool
+):
+    """Offer to generate a template's missing dependencies first."""
+    if not template.get('dependencies'):
+        return
+
+    from opsartisan.core.dependency_resolver import DependencyResolver
+
+    click.echo("Checking dependencies...")
+    resolver = DependencyResolver(manager)
+    missing = resolver.check_dependencies(template)
+
+    if not missing:
+        return
+
+    click.echo(click.style(
+        f"\nMissing dependencies: {', '.join(missing)}",
+        fg='yellow'
+    ))
+    if yes or click.confirm("Generate missing dependencies first?"):
+        for dep_id in missing:
+            click.echo(f"\nGenerating dependency: {dep_id}")
+            _generate_dependency(manager, dep_id, out_dir)
+    else:
+        click.echo("Cannot proceed without dependencies.")
+        sys.exit(1)
+
+
+def _generate_dependency(manager: 'TemplateManager', dep_id: str, out_dir: str):
+    """Generate a dependency with its default answers, like 'new --yes'."""
+    from opsartisan.core.prompter import InteractivePrompter
+
+    template = manager.get_template(dep_id)
+
+    if not template:
+        click.echo(f"Error: Template '{dep_id}' not found.", err=True)
+        sys.exit(1)
+
+    _ensure_dependencies(manager, template, out_dir, yes=True)
+
+    click.echo(f"Creating {template['title']}")
+    click.echo(f"  {template.get('description', '')}\n")
+
+    prompter = InteractivePrompter()
+    answers = prompter.prompt(template.get('prompts', []), use_defaults=True)
+
+    _echo_configuration(answers)
+
+    _generate(manager, template, answers, Path(out_dir), 'prompt')
+
+
+def _echo_configuration(answers: Dict[str, Any]):
+    """Print the answers a template will be generated with."""
+    lines = ["\nConfiguration:"]
+    lines.extend(f"  {key}: {value}" for key, value in answers.items())
+    click.echo('\n'.join(lines))
+
+
+def _generate(
+        manager: 'TemplateManager',
+        template: Dict[str, Any],
+        answers: Dict[str, Any],
+        out_path: Path,
+        merge: str,
+        validate: bool = False,
+        test: bool = False,
+        async_validation: bool = False,
+        fail_fast: bool = False
+):
+    """Render a template, then run its validators, tests and hooks."""
+    out_path.mkdir(parents=True, exist_ok=True)
+
+    try:
+        created_files = manager.render_template(
+            template, answers, out_path, merge_strategy=merge
+        )
+
+        lines = [click.style("\n✓ Generated files:", fg='green')]
+        lines.extend(f"  {file_path}" for file_path in created_files)
+        click.echo('\n'.join(lines))
+
+        if validate or test:
+            from opsartisan.core.validator import Validator
+
+        # Run validators
+        if validate:
+            click.echo("\nRunning validators...")
+            if async_validation:
+                success = Validator.run_validators_async(
+                    template, out_path, fail_fast=fail_fast
+                )
+            else:
+                success = Validator.run_validators(template, out_path)
+
+            if not success:
+                click.echo(click.style(
+                    "\n⚠ Some validators failed. Check output above.",
+                    fg='yellow'
+                ))
+
+        # Run tests
+        if test:
+            click.echo("\nRunning tests...")
+            Validator.run_tests(template, out_path)
+
+        # Execute post-generation hooks
+        if template.get('hooks', {}).get('post_generation'):
+            from opsartisan.core.hooks import HookExecutor
+
+            click.echo("\nRunning post-generation hooks...")
+            HookExecutor.execute_hooks(
+                template['hooks']['post_generation'],
+                out_path,
+                answers
+            )
+
+        # Show next steps
+        next_steps = template.get('next_steps', [])
+        if next_steps:
+            lines = ["\nNext steps:"]
+            lines.extend(f"  • {step}" for step in next_steps)
+            click.echo('\n'.join(lines))
+
+    except Exception as e:
+        click.echo(f"\nError generating files: {e}", err=True)
+        if (click.get_current_context().obj or {}).get('debug'):
+            import traceback
+            traceback.print_exc()
+        sys.exit(1)
@@ -0,0 +1,77 @@
+"""Plugin management commands."""
+
+import sys
+import click
+
+from opsartisan.config import USER_CONFIG_DIR
+
+
+@click.group()
+def plugin():
+    """Manage plugins."""
+    pass
+
+
+@plugin.command('list')
+def plugin_list():
+    """List all installed plugins."""
+    from opsartisan.core.plugin_manager import get_plugin_manager
+
+    plugin_manager = get_plugin_manager()
+
+    plugins = plugin_manager.list_plugins()
+
+    total = sum(len(p) for p in plugins.values())
+
+    if total == 0:
+        click.echo("No plugins installed.")
+        click.echo(f"\nAdd plugins to: {USER_CONFIG_DIR / 'plugins'}")
+        return
+
+    click.echo(f"Installed plugins ({total}):\n")
+
+    if plugins['validators']:
+        click.echo(click.style("Validators:", fg='cyan', bold=True))
+        for name in plugins['validators']:
+            click.echo(f"  • {name}")
+        click.echo()
+
+    if plugins['renderers']:
+        click.echo(click.style("Renderers:", fg='cyan', bold=True))
+        for name in plugins['renderers']:
+            click.echo(f"  • {name}")
+        click.echo()
+
+    if plugins['filters']:
+        click.echo(click.style("Jinja2 Filters:", fg='cyan', bold=True))
+        for name in plugins['filters']:
+            click.echo(f"  • {name}")
+
+
+@plugin.command('info')
+@click.argument('plugin_name')
+def plugin_info(plugin_name: str):
+    """Show information about a specific plugin."""
+    from opsartisan.core.plugin_manager import get_plugin_manager
+
+    plugin_manager = get_plugin_manager()
+
+    kind, plugin = plugin_manager.find(plugin_name)
+
+    if not plugin:
+        click.echo(f"Plugin '{plugin_name}' not found.", err=True)
+        sys.exit(1)
+
+    click.echo(click.style(f"\n{plugin.name}", fg='cyan', bold=True))
+    click.echo(f"Version: {plugin.version}")
+
+    if kind == 'validator':
+        click.echo("Type: Validator")
+    elif kind == 'renderer':
+        click.echo("Type: Renderer")
+    elif kind == 'filters':
+        click.echo("Type: Jinja2 Filters")
+        filters = plugin.get_filters()
+        click.echo(f"\nProvides {len(filters)} filter(s):")
+        for filter_name in filters.keys():
+            click.echo(f"  • {filter_name}")
@@ -0,0 +1,114 @@
+"""Preset management commands."""
+
+import sys
+import click
+
+
+@click.group()
+def preset():
+    """Manage saved presets."""
+    pass
+
+
+@preset.command('list')
+def preset_list():
+    """List all saved presets."""
+    from opsartisan.core.preset_manager import PresetManager
+
+    presets = PresetManager.load_presets()
+
+    if not presets:
+        click.echo("No presets saved yet.")
+        click.echo("Create one with: opsartisan save-preset <name> <template_id>")
+        return
+
+    lines = [f"Saved presets ({len(presets)}):\n"]
+    for name, data in presets.items():
+        lines.append(f"  {click.style(name, fg='green', bold=True)}")
+        lines.append(f"    Template: {data['template_id']}")
+        lines.append(f"    Options: {len(data['answers'])} configured")
+        lines.append('')
+
+    click.echo('\n'.join(lines))
+
+
+@preset.command('show')
+@click.argument('name')
+def preset_show(name: str):
+    """Show preset details."""
+    from opsartisan.core.preset_manager import PresetManager
+
+    preset_data = PresetManager.get_preset(name)
+
+    if not preset_data:
+        click.echo(f"Error: Preset '{name}' not found.", err=True)
+        sys.exit(1)
+
+    click.echo(f"Preset: {click.style(name, fg='green', bold=True)}")
+    click.echo(f"Template: {preset_data['template_id']}\n")
+    click.echo("Configuration:")
+    for key, value in preset_data['answers'].items():
+        click.echo(f"  {key}: {value}")
+
+
+@preset.command('edit')
+@click.argument('name')
+def preset_edit(name: str):
+    """Edit an existing preset."""
+    from opsartisan.core.template_manager import get_template_manager
+    from opsartisan.core.preset_manager import PresetManager
+    from opsartisan.core.prompter import InteractivePrompter
+
+    preset_data = PresetManager.get_preset(name)
+
+    if not preset_data:
+        click.echo(f"Error: Preset '{name}' not found.", err=True)
+        sys.exit(1)
+
+    template_id = preset_data['template_id']
+    manager = get_template_manager()
+    template = manager.get_template(template_id)
+
+    if not template:
+        click.echo(
+            f"Error: Template '{template_id}' not found. "
+            f"Preset may be outdated.",
+            err=True
+        )
+        sys.exit(1)
+
+    click.echo(f"Editing preset '{name}' for {template['title']}\n")
+    click.echo("Current values will be shown as defaults.\n")
+
+    # Use current answers as defaults
+    prompter = InteractivePrompter()
+    new_answers = prompter.prompt(
+        template.get('prompts', []),
+        defaults=preset_data['answers']
+    )
+
+    PresetManager.save_preset(name, template_id, new_answers)
+    click.echo(click.style(f"\n✓ Updated preset '{name}'", fg='green'))
+
+
+@preset.command('delete')
+@click.argument('name')
+@click.option('--yes', is_flag=True, help='Skip confirmation')
+def preset_delete(name: str, yes: bool):
+    """Delete a preset."""
+    from opsartisan.core.preset_manager import PresetManager
+    from opsartisan.core.prompter import confirm
+
+    preset_data = PresetManager.get_preset(name)
+
+    if not preset_data:
+        click.echo(f"Error: Preset '{name}' not found.", err=True)
+        sys.exit(1)
+
+    if not yes:
+        if not confirm(f"Delete preset '{name}'?"):
+            click.echo("Cancelled.")
+            return
+
+    PresetManager.delete_preset(name)
+    click.echo(click.style(f"✓ Deleted preset '{name}'", fg='green'))
@@ -0,0 +1,30 @@
+"""Interactive preset creation command."""
+
+import click
+import sys
+
+
+@click.command()
+@click.argument('name')
+@click.argument('template_id')
+def save_preset(name: str, template_id: str):
+    """Save current answers as a preset (interactive)."""
+    from opsartisan.core.template_manager import get_template_manager
+    from opsartisan.core.preset_manager import PresetManager
+    from opsartisan.core.prompter import InteractivePrompter
+
+    manager = get_template_manager()
+    template = manager.get_template(template_id)
+
+    if not template:
+        click.echo(f"Error: Template '{template_id}' not found.", err=True)
+        sys.exit(1)
+
+    click.echo(f"Creating preset '{name}' for {template['title']}\n")
+
+    prompter = InteractivePrompter()
+    answers = prompter.prompt(template.get('prompts', []))
+
+    PresetManager.save_preset(name, template_id, answers)
+    click.echo(click.style(f"\n✓ Saved preset '{name}'", fg='green'))
+    click.echo(f"Use with: opsartisan new {template_id} --preset {name}")
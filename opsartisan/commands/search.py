@@ -0,0 +1,27 @@
+"""Local template search command."""
+
+import click
+
+
+@click.command()
+@click.argument('keyword')
+def search(keyword: str):
+    """Search for templates by keyword."""
+    from opsartisan.core.template_manager import get_template_manager
+
+    manager = get_template_manager()
+    templates = manager.search_templates(keyword)
+
+    if not templates:
+        click.echo(f"No templates found matching '{keyword}'")
+        return
+
+    lines = [f"Found {len(templates)} template(s) matching '{keyword}':\n"]
+    for template in templates:
+        lines.append(f"  {click.style(template['id'], fg='green', bold=True)}")
+        lines.append(f"    {template.get('description', 'No description')}")
+        if template.get('tags'):
+            lines.append(f"    Tags: {', '.join(template['tags'])}")
+        lines.append('')
+
+    click.echo('\n'.join(lines))
@@ -0,0 +1,48 @@
+"""Template statistics command."""
+
+from heapq import nlargest
+from operator import itemgetter
+import click
+
+
+@click.command()
+@click.option('--json', 'as_json', is_flag=True, help='Print the statistics as JSON')
+def stats(as_json: bool):
+    """Show template statistics and usage info."""
+    from opsartisan.core.template_manager import get_template_manager
+    from opsartisan.core.preset_manager import PresetManager
+
+    manager = get_template_manager()
+    stats = manager.get_template_stats()
+
+    if as_json:
+        from opsartisan.utils.json_utils import json_dumps
+
+        stats['saved_presets'] = len(PresetManager.load_presets())
+        click.echo(json_dumps(stats))
+        return
+
+    click.echo(click.style("\n📊 OpsArtisan Statistics\n", fg='cyan', bold=True))
+
+    click.echo(f"Total templates: {click.style(str(stats['total_templates']), fg='green', bold=True)}")
+
+    if stats['categories']:
+        click.echo("\nBy category:")
+        for category, count in sorted(
+                stats['categories'].items(), key=itemgetter(1), reverse=True
+        ):
+            click.echo(f"  {category}: {count}")
+
+    if stats['tags']:
+        click.echo("\nPopular tags:")
+        top_tags = nlargest(10, stats['tags'].items(), key=itemgetter(1))
+        for tag, count in top_tags:
+            click.echo(f"  {tag}: {count}")
+
+    click.echo("\nTemplate directories:")
+    for directory in stats['template_dirs']:
+        click.echo(f"  • {directory}")
+
+    # Preset statistics
+    presets = PresetManager.load_presets()
+    click.echo(f"\nSaved presets: {len(presets)}")
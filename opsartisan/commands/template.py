@@ -0,0 +1,84 @@
+"""Template marketplace commands."""
+
+import sys
+from typing import Optional
+import click
+
+
+@click.group()
+def template():
+    """Manage templates."""
+    pass
+
+
+@template.command('search')
+@click.argument('keyword')
+def template_search(keyword: str):
+    """Search for templates in the marketplace."""
+    from opsartisan.core.marketplace import TemplateMarketplace
+
+    marketplace = TemplateMarketplace()
+
+    click.echo(f"Searching marketplace for '{keyword}'...")
+    results = list(marketplace.search(keyword))
+
+    if not results:
+        click.echo(f"No templates found matching '{keyword}'")
+        return
+
+    lines = [f"\nFound {len(results)} template(s):\n"]
+    for result in results:
+        installed = "✓ installed" if result.get('installed') else ""
+        lines.append(
+            f"  {click.style(result['id'], fg='green', bold=True)} {installed}"
+        )
+        lines.append(f"    {result['description']}")
+        lines.append(f"    Author: {result.get('author', 'Unknown')}")
+        if result.get('downloads'):
+            lines.append(f"    Downloads: {result['downloads']}")
+        lines.append('')
+
+    lines.append("Install with: opsartisan template install <template_id>")
+
+    click.echo('\n'.join(lines))
+
+
+@template.command('install')
+@click.argument('source')
+@click.option('--name', help='Custom template ID')
+def template_install(source: str, name: Optional[str]):
+    """Install a template from URL or marketplace."""
+    from opsartisan.core.marketplace import TemplateMarketplace
+
+    marketplace = TemplateMarketplace()
+
+    try:
+        if source.startswith(('http://', 'https://', 'git@')):
+            # Git URL
+            click.echo(f"Installing template from {source}...")
+            template_id = marketplace.install_from_git(source, custom_name=name)
+        else:
+            # Marketplace ID
+            click.echo(f"Installing template '{source}' from marketplace...")
+            template_id = marketplace.install_from_marketplace(source)
+
+        click.echo(click.style(
+            f"\n✓ Successfully installed template '{template_id}'",
+            fg='green'
+        ))
+        click.echo(f"Use with: opsartisan new {template_id}")
+
+    except Exception as e:
+        click.echo(f"Error installing template: {e}", err=True)
+        sys.exit(1)
+
+
+@template.command('update')
+@click.argument('template_ids', nargs=-1, required=True)
+def template_update(template_ids: tuple):
+    """Update installed marketplace templates to their latest version."""
+    from opsartisan.core.marketplace import TemplateMarketplace
+
+    results = TemplateMarketplace().update_many(list(template_ids))
+    if not all(results):
+        sys.exit(1)
@@ -0,0 +1,106 @@
+"""Validation of user-provided files against a template."""
+
+import sys
+from pathlib import Path
+import click
+
+
+# Map template IDs to validation commands; '{path}' is replaced with the file
+_FILE_VALIDATORS = {
+    "dockerfile": ("docker", "build", "-f", "{path}", "."),
+    "docker-compose": ("docker", "compose", "config", "-q"),
+    "kubernetes": ("kubectl", "apply", "--dry-run=client", "-f", "{path}"),
+    "ansible": ("ansible-playbook", "--syntax-check", "{path}"),
+    "systemd": ("systemd-analyze", "verify", "{path}"),
+    "terraform": ("terraform", "validate"),
+}
+
+
+@click.command("validate-file")
+@click.argument("template_id")
+@click.argument("file_path", type=click.Path(exists=True))
+@click.option(
+    "--stream",
+    is_flag=True,
+    help="Show the validator's output as it runs"
+)
+def validate_file_cli(template_id: str, file_path: str, stream: bool):
+    """
+    Validate a user-provided file against a template's expected syntax.
+    Example: opsartisan validate-file docker-compose ./docker-compose.yml
+    """
+    from opsartisan.core.template_manager import get_template_manager
+
+    template = get_template_manager().get_template(template_id)
+    if not template:
+        click.echo(f"Error: Template '{template_id}' not found.", err=True)
+        sys.exit(1)
+
+    file_path = Path(file_path)
+    click.echo(
+        f"Validating '{file_path}' against template '{template_id}'...\n"
+    )
+
+    validator_spec = _FILE_VALIDATORS.get(template_id)
+    if not validator_spec:
+        click.echo(
+            f"No validator configured for template '{template_id}'",
+            err=True
+        )
+        sys.exit(1)
+
+    cmd = [
+        arg.format(path=file_path) if '{path}' in arg else arg
+        for arg in validator_spec
+    ]
+
+    import subprocess
+    try:
+        click.echo(f"Running command: {' '.join(cmd)}")
+        if stream:
+            _run_streamed(cmd)
+        else:
+            result = subprocess.run(
+                cmd, check=True, capture_output=True, text=True
+            )
+            if result.stdout:
+                click.echo(result.stdout.rstrip())
+        click.echo(
+            click.style(
+                f"\n✅ File '{file_path}' is valid for "
+                f"template '{template_id}'",
+                fg="green"
+            )
+        )
+    except subprocess.CalledProcessError as e:
+        click.echo(
+            click.style(f"\n❌ Validation failed for '{file_path}'", fg="red")
+        )
+        output = e.stderr or e.stdout
+        if output:
+            click.echo(output.rstrip())
+        sys.exit(1)
+    except Exception as e:
+        click.echo(
+            click.style(f"\n❌ Error during validation: {e}", fg="red")
+        )
+        sys.exit(1)
+
+
+def _run_streamed(cmd):
+    """Run a validator, echoing its combined output line by line."""
+    import subprocess
+
+    with subprocess.Popen(
+            cmd,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.STDOUT,
+            text=True,
+            bufsize=1
+    ) as proc:
+        for line in proc.stdout:
+            click.echo(line, nl=False)
+
+    if proc.returncode:
+        # Output was already shown, so the error carries none
+        raise subprocess.CalledProcessError(proc.returncode, cmd)
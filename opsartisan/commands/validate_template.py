@@ -0,0 +1,74 @@
+"""Template definition validation command."""
+
+import sys
+import click
+
+
+@click.command('validate')
+@click.argument('template_id')
+@click.option('--check-deps', is_flag=True, help='Check dependencies')
+@click.option('--check-tools', is_flag=True, help='Check required tools')
+def validate_template(template_id: str, check_deps: bool, check_tools: bool):
+    """Validate a template definition."""
+    from opsartisan.core.template_manager import get_template_manager
+
+    manager = get_template_manager()
+    template = manager.get_template(template_id)
+
+    if not template:
+        click.echo(f"Error: Template '{template_id}' not found.", err=True)
+        sys.exit(1)
+
+    click.echo(f"Validating template: {template['title']}\n")
+
+    # Basic validation
+    result = manager.validate_template(template)
+
+    if result['errors']:
+        click.echo(click.style("❌ Errors:", fg='red', bold=True))
+        for error in result['errors']:
+            click.echo(f"  • {error}")
+
+    if result['warnings']:
+        click.echo(click.style("\n⚠️  Warnings:", fg='yellow', bold=True))
+        for warning in result['warnings']:
+            click.echo(f"  • {warning}")
+
+    # Check dependencies
+    if check_deps and template.get('dependencies'):
+        from opsartisan.core.dependency_resolver import DependencyResolver
+
+        click.echo(click.style("\n🔗 Dependencies:", fg='cyan', bold=True))
+        resolver = DependencyResolver(manager)
+
+        dep_result = resolver.validate_all_dependencies(template)
+        if dep_result['valid']:
+            click.echo(click.style("  ✓ All dependencies valid", fg='green'))
+        else:
+            for error in dep_result['errors']:
+                click.echo(click.style(f"  ✗ {error}", fg='red'))
+
+        # Show dependency tree
+        click.echo("\nDependency tree:")
+        tree = resolver.get_dependency_tree(template)
+        click.echo(tree)
+
+    # Check required tools
+    if check_tools and template.get('required_tools'):
+        from opsartisan.utils.process_utils import which_all
+
+        click.echo(click.style("\n🔧 Required Tools:", fg='cyan', bold=True))
+        tool_paths = which_all(template['required_tools'])
+        for tool in template['required_tools']:
+            if tool_paths[tool]:
+                click.echo(click.style(f"  ✓ {tool} found", fg='green'))
+            else:
+                click.echo(click.style(f"  ✗ {tool} not found", fg='red'))
+
+    # Summary
+    click.echo()
+    if result['valid'] and not result['errors']:
+        click.echo(click.style("✓ Template is valid", fg='green', bold=True))
+    else:
+        click.echo(click.style("✗ Template has issues", fg='red', bold=True))
+        sys.exit(1)
@@ -1,19 +1,22 @@
 """Configuration and constants for OpsArtisan."""
 
+import importlib.util
 from pathlib import Path
 # Version
 __version__ = "2.0.0"
 
 # Configuration paths
-USER_CONFIG_DIR = Path.home() / ".opsartisan"
+_HOME = Path.home()
+USER_CONFIG_DIR = _HOME / ".opsartisan"
 USER_TEMPLATES_DIR = USER_CONFIG_DIR / "templates"
 PRESETS_FILE = USER_CONFIG_DIR / "presets.json"
+JINJA_CACHE_DIR = USER_CONFIG_DIR / "jinja_cache"
 LOCAL_TEMPLATES_DIR = Path.cwd() / 'templates'
 SYSTEM_TEMPLATES_DIR = Path("/usr/share/opsartisan/templates")
+USER_CACHE_DIR = _HOME / ".cache" / "opsartisan"
+TEMPLATE_INDEX_FILE = USER_CACHE_DIR / "index.json"
+PLUGIN_INDEX_FILE = USER_CACHE_DIR / "plugins.json"
 
-# Questionary availability
-try:
-    import questionary
-    HAS_QUESTIONARY = True
-except ImportError:
-    HAS_QUESTIONARY = False
\ No newline at end of file
+# Questionary availability (checked without importing it; callers import
+# questionary lazily when they actually prompt)
+HAS_QUESTIONARY = importlib.util.find_spec('questionary') is not None
\ No newline at end of file
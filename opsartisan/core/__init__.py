@@ -1,13 +1,26 @@
 """Core functionality for OpsArtisan."""
 
-from opsartisan.core.template_manager import TemplateManager
-from opsartisan.core.preset_manager import PresetManager
-from opsartisan.core.validator import Validator
-from opsartisan.core.prompter import InteractivePrompter
-
-__all__ = [
-    "TemplateManager",
-    "PresetManager",
-    "Validator",
-    "InteractivePrompter",
-]
+# Resolved lazily by __getattr__ below
+_EXPORTS = {
+    "TemplateManager": "opsartisan.core.template_manager",
+    "PresetManager": "opsartisan.core.preset_manager",
+    "Validator": "opsartisan.core.validator",
+    "InteractivePrompter": "opsartisan.core.prompter",
+}
+
+__all__ = list(_EXPORTS)
+
+
+def __getattr__(name):
+    if name in _EXPORTS:
+        import importlib
+
+        obj = getattr(importlib.import_module(_EXPORTS[name]), name)
+        # Cache it so later lookups skip __getattr__ entirely
+        globals()[name] = obj
+        return obj
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return sorted({*globals(), *_EXPORTS})
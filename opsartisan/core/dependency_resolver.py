@@ -1,8 +1,14 @@
 """Dependency resolution for templates."""
 
-from typing import Dict, Any, List, Set
+import textwrap
+from collections import deque
+from typing import Dict, Any, Iterator, List, Tuple
 import click
 
+# DFS states in _collect_dependency_graph; unvisited templates have none
+_VISITING = 1
+_DONE = 2
+
 
 class DependencyResolver:
     """Resolves and checks template dependencies."""
@@ -10,6 +16,7 @@ class DependencyResolver:
     def __init__(self, template_manager):
         self.template_manager = template_manager
         self._resolution_cache = {}
+        self._tree_cache = {}
 
     def check_dependencies(self, template: Dict[str, Any]) -> List[str]:
         """
@@ -39,62 +46,108 @@ class DependencyResolver:
         if template_id in self._resolution_cache:
             return self._resolution_cache[template_id]
 
-        visited = set()
+        try:
+            graph = self._collect_dependency_graph(template_id)
+        except ValueError as e:
+            click.echo(click.style(f"Dependency error: {e}", fg='red'), err=True)
+            raise
+
+        # Kahn's algorithm: a template is ready once all its dependencies are placed
+        remaining = {}
+        dependents = {tid: [] for tid in graph}
+        for tid, dep_ids in graph.items():
+            unique = dict.fromkeys(dep_ids)
+            remaining[tid] = len(unique)
+            for dep_id in unique:
+                dependents[dep_id].append(tid)
+
+        ready = deque(tid for tid, count in remaining.items() if count == 0)
         order = []
+        while ready:
+            tid = ready.popleft()
+            order.append(tid)
+            for dependent in dependents[tid]:
+                remaining[dependent] -= 1
+                if remaining[dependent] == 0:
+                    ready.append(dependent)
 
-        def visit(tid: str, path: Set[str]):
-            if tid in path:
-                cycle = ' -> '.join(path) + f' -> {tid}'
-                raise ValueError(
-                    f"Circular dependency detected: {cycle}"
-                )
+        self._resolution_cache[template_id] = order
+        return order
 
-            if tid in visited:
-                return
+    def _collect_dependency_graph(self, template_id: str) -> Dict[str, List[str]]:
+        """
+        Map every template reachable from template_id to its dependencies.
+        Raises ValueError for a missing template or a circular dependency.
+        """
+        graph: Dict[str, List[str]] = {}
+        state: Dict[str, int] = {}
+        # Templates on the current DFS path, with their unvisited dependencies
+        stack: List[Tuple[str, Iterator[str]]] = []
 
+        def enter(tid: str):
             tmpl = self.template_manager.get_template(tid)
             if not tmpl:
                 raise ValueError(f"Dependency template not found: {tid}")
+            graph[tid] = list(tmpl.get('dependencies', []))
+            state[tid] = _VISITING
+            stack.append((tid, iter(graph[tid])))
+
+        enter(template_id)
+        while stack:
+            tid, pending = stack[-1]
+            for dep_id in pending:
+                dep_state = state.get(dep_id)
+                if dep_state is None:
+                    enter(dep_id)
+                    break
+                if dep_state == _VISITING:
+                    path = [t for t, _ in stack]
+                    cycle = path[path.index(dep_id):] + [dep_id]
+                    raise ValueError(
+                        f"Circular dependency detected: {' -> '.join(cycle)}"
+                    )
+            else:
+                state[tid] = _DONE
+                stack.pop()
 
-            visited.add(tid)
-            path.add(tid)
-
-            # Visit dependencies first
-            for dep_id in tmpl.get('dependencies', []):
-                visit(dep_id, path.copy())
-
-            order.append(tid)
-
-        try:
-            visit(template_id, set())
-        except ValueError as e:
-            click.echo(click.style(f"Dependency error: {e}", fg='red'), err=True)
-            raise
-
-        self._resolution_cache[template_id] = order
-        return order
+        return graph
 
     def get_dependency_tree(self, template: Dict[str, Any], level: int = 0) -> str:
         """
         Generate a visual dependency tree.
         """
+        if level > 0:
+            return textwrap.indent(self._get_subtree(template), "  " * level)
+
         template_id = template.get('id')
         title = template.get('title', template_id)
+        return f"{title} ({template_id})\n" + ''.join(self._get_child_trees(template))
 
-        indent = "  " * level
-        prefix = "└─ " if level > 0 else ""
+    def _get_subtree(self, template: Dict[str, Any]) -> str:
+        """Tree for a dependency, drawn as if it were at level 1 with no indent."""
+        template_id = template.get('id')
 
-        tree = f"{indent}{prefix}{title} ({template_id})\n"
+        if template_id in self._tree_cache:
+            return self._tree_cache[template_id]
 
-        dependencies = template.get('dependencies', [])
-        for dep_id in dependencies:
+        title = template.get('title', template_id)
+        parts = [f"└─ {title} ({template_id})\n"]
+        parts.extend(self._get_child_trees(template))
+
+        tree = ''.join(parts)
+        self._tree_cache[template_id] = tree
+        return tree
+
+    def _get_child_trees(self, template: Dict[str, Any]) -> List[str]:
+        """Trees for each of a template's dependencies, one level deeper."""
+        parts = []
+        for dep_id in template.get('dependencies', []):
             dep_template = self.template_manager.get_template(dep_id)
             if dep_template:
-                tree += self.get_dependency_tree(dep_template, level + 1)
+                parts.append(textwrap.indent(self._get_subtree(dep_template), "  "))
             else:
-                tree += f"{indent}  └─ ⚠️  {dep_id} (not found)\n"
-
-        return tree
+                parts.append(f"  └─ ⚠️  {dep_id} (not found)\n")
+        return parts
 
     def validate_all_dependencies(self, template: Dict[str, Any]) -> Dict[str, Any]:
         """
@@ -5,6 +5,8 @@ from pathlib import Path
 from typing import Dict, Any, List, Optional
 import click
 
+from opsartisan.utils.json_utils import load_json, dump_json
+
 
 class EnvironmentManager:
     """Manages environment-specific configurations."""
@@ -39,8 +41,7 @@ class EnvironmentManager:
 
         # Save environment config
         env_file = self.env_dir / f'{env_name}.json'
-        with open(env_file, 'w') as f:
-            json.dump(env_config, f, indent=2)
+        dump_json(env_config, env_file)
 
         click.echo(f"Created environment config: {env_file}")
         return env_file
@@ -52,8 +53,7 @@ class EnvironmentManager:
         if not env_file.exists():
             return None
 
-        with open(env_file) as f:
-            return json.load(f)
+        return load_json(env_file)
 
     def list_environments(self) -> List[str]:
         """List all available environments."""
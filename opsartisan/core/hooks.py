@@ -1,15 +1,61 @@
 """Hook execution for pre and post generation actions."""
 
-import subprocess
 import os
+import re
+import subprocess
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Dict, Any, List
+from types import MappingProxyType
+from typing import Dict, Any, List, Mapping, Optional, Tuple
 import click
 
+# '{{name}}' placeholders in hook commands
+_VAR_RE = re.compile(r'\{\{\s*([^{}\s]+)\s*\}\}')
+
+# Built-in hook patterns, frozen so the shared copy can't be mutated
+_COMMON_HOOKS = MappingProxyType({
+    name: tuple(MappingProxyType(hook) for hook in hooks)
+    for name, hooks in {
+        'git_init': [
+            {
+                'type': 'git',
+                'command': 'init',
+                'description': 'Initialize git repository',
+                'on_failure': 'warn'
+            },
+            {
+                'type': 'git',
+                'command': 'add .',
+                'description': 'Stage all files',
+                'on_failure': 'warn'
+            }
+        ],
+        'make_executable': [
+            {
+                'type': 'chmod',
+                'command': '755 {{filename}}',
+                'description': 'Make file executable',
+                'on_failure': 'warn'
+            }
+        ],
+        'docker_build': [
+            {
+                'type': 'shell',
+                'command': 'docker build -t {{image_name}} .',
+                'description': 'Build Docker image',
+                'on_failure': 'fail'
+            }
+        ]
+    }.items()
+})
+
 
 class HookExecutor:
     """Executes pre and post generation hooks."""
 
+    # Upper bound on 'parallel' hooks run concurrently
+    MAX_WORKERS = 8
+
     @staticmethod
     def execute_hooks(
             hooks: List[Dict[str, Any]],
@@ -31,59 +77,112 @@ class HookExecutor:
             return True
 
         all_passed = True
-
-        for hook in hooks:
-            hook_type = hook.get('type', 'shell')
-            description = hook.get('description', 'Running hook')
-            command = hook.get('command', '')
-            on_failure = hook.get('on_failure', 'warn')  # warn, fail, ignore
-            env = hook.get('env', {})
-
-            click.echo(f"  • {description}")
-
-            try:
-                success = HookExecutor._execute_hook(
-                    hook_type,
-                    command,
-                    working_dir,
-                    context,
-                    env
-                )
-
-                if success:
-                    click.echo(click.style(f"    ✓ Completed", fg='green'))
-                else:
-                    msg = f"    ✗ Failed"
-                    if on_failure == 'fail':
-                        click.echo(click.style(msg, fg='red'))
-                        all_passed = False
-                    elif on_failure == 'warn':
-                        click.echo(click.style(msg, fg='yellow'))
-                    # ignore: don't report at all
-
-            except Exception as e:
-                msg = f"    ✗ Error: {e}"
-                if on_failure == 'fail':
-                    click.echo(click.style(msg, fg='red'))
+        commands = HookExecutor._substitute_variables(hooks, context)
+
+        for group in HookExecutor._group_hooks(hooks):
+            if len(group) == 1:
+                # Announce a lone hook before running it, as it may take a while
+                click.echo(f"  • {group[0].get('description', 'Running hook')}")
+                outcomes = [HookExecutor._run_hook(group[0], working_dir, commands)]
+            else:
+                with ThreadPoolExecutor(
+                        max_workers=min(HookExecutor.MAX_WORKERS, len(group))
+                ) as executor:
+                    outcomes = list(executor.map(
+                        lambda h: HookExecutor._run_hook(h, working_dir, commands),
+                        group
+                    ))
+
+            # Report in declaration order
+            for hook, (success, error) in zip(group, outcomes):
+                if len(group) > 1:
+                    click.echo(f"  • {hook.get('description', 'Running hook')}")
+                if not HookExecutor._report_hook(hook, success, error):
                     all_passed = False
-                elif on_failure == 'warn':
-                    click.echo(click.style(msg, fg='yellow'))
 
         return all_passed
 
+    @staticmethod
+    def _substitute_variables(
+            hooks: List[Dict[str, Any]],
+            context: Dict[str, Any]
+    ) -> Dict[str, str]:
+        """
+        Map each distinct hook command to its {{variable}}-substituted form,
+        so commands repeated across a batch are only substituted once.
+        Unknown names are left as-is.
+        """
+        def replace(match: re.Match) -> str:
+            name = match.group(1)
+            return str(context[name]) if name in context else match.group(0)
+
+        return {
+            command: _VAR_RE.sub(replace, command)
+            for command in dict.fromkeys(hook.get('command', '') for hook in hooks)
+        }
+
+    @staticmethod
+    def _group_hooks(hooks: List[Dict[str, Any]]) -> List[List[Dict[str, Any]]]:
+        """
+        Split hooks into groups that run one after another.
+        Consecutive hooks marked 'parallel' share a group and run
+        concurrently; every other hook is a group of its own.
+        """
+        groups = []
+        for hook in hooks:
+            if hook.get('parallel') and groups and groups[-1][-1].get('parallel'):
+                groups[-1].append(hook)
+            else:
+                groups.append([hook])
+        return groups
+
+    @staticmethod
+    def _run_hook(
+            hook: Dict[str, Any],
+            working_dir: Path,
+            commands: Dict[str, str]
+    ) -> Tuple[bool, Optional[Exception]]:
+        """Run one hook with its substituted command, returning (success, error)."""
+        try:
+            success = HookExecutor._execute_hook(
+                hook.get('type', 'shell'),
+                commands[hook.get('command', '')],
+                working_dir,
+                hook.get('env', {})
+            )
+            return success, None
+        except Exception as e:
+            return False, e
+
+    @staticmethod
+    def _report_hook(
+            hook: Dict[str, Any],
+            success: bool,
+            error: Optional[Exception]
+    ) -> bool:
+        """Print a hook's outcome; returns False if it should fail the run."""
+        if success:
+            click.echo(click.style(f"    ✓ Completed", fg='green'))
+            return True
+
+        on_failure = hook.get('on_failure', 'warn')  # warn, fail, ignore
+        msg = f"    ✗ Error: {error}" if error else f"    ✗ Failed"
+        if on_failure == 'fail':
+            click.echo(click.style(msg, fg='red'))
+            return False
+        elif on_failure == 'warn':
+            click.echo(click.style(msg, fg='yellow'))
+        # ignore: don't report at all
+        return True
+
     @staticmethod
     def _execute_hook(
             hook_type: str,
             command: str,
             working_dir: Path,
-            context: Dict[str, Any],
             extra_env: Dict[str, str]
     ) -> bool:
-        """Execute a single hook."""
-
-        # Substitute variables in command
-        for key, value in context.items():
-            command = command.replace(f"{{{{{key}}}}}", str(value))
+        """Execute a single hook whose {{variables}} are already substituted."""
 
         # Prepare environment
         env = os.environ.copy()
@@ -135,53 +234,14 @@ class HookExecutor:
     @staticmethod
     def _execute_git(command: str, working_dir: Path, env: Dict) -> bool:
         """Execute a git command."""
-        full_command = f"git {command}"
-        result = subprocess.run(
-            full_command,
-            shell=True,
-            cwd=str(working_dir),
-            env=env,
-            capture_output=True,
-            text=True,
-            timeout=30
-        )
-        return result.returncode == 0
+        return HookExecutor._execute_shell(f"git {command}", working_dir, env)
 
     @staticmethod
-    def get_common_hooks() -> Dict[str, List[Dict[str, Any]]]:
+    def get_common_hooks() -> Mapping[str, Tuple[Mapping[str, Any], ...]]:
         """
         Get a dictionary of common hook patterns.
         Templates can reference these by name.
+
+        The mapping is shared and read-only; copy a hook before changing it.
         """
-        return {
-            'git_init': [
-                {
-                    'type': 'git',
-                    'command': 'init',
-                    'description': 'Initialize git repository',
-                    'on_failure': 'warn'
-                },
-                {
-                    'type': 'git',
-                    'command': 'add .',
-                    'description': 'Stage all files',
-                    'on_failure': 'warn'
-                }
-            ],
-            'make_executable': [
-                {
-                    'type': 'chmod',
-                    'command': '755 {{filename}}',
-                    'description': 'Make file executable',
-                    'on_failure': 'warn'
-                }
-            ],
-            'docker_build': [
-                {
-                    'type': 'shell',
-                    'command': 'docker build -t {{image_name}} .',
-                    'description': 'Build Docker image',
-                    'on_failure': 'fail'
-                }
-            ]
-        }
\ No newline at end of file
+        return _COMMON_HOOKS
\ No newline at end of file
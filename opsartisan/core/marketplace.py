@@ -1,24 +1,47 @@
 """Template marketplace for discovering and installing remote templates."""
 
-import json
+import os
+import re
 import subprocess
+import sys
 import tempfile
 import shutil
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import List, Dict, Any, Optional
+from typing import Iterator, List, Dict, Any, Optional
 import click
 
-from opsartisan.config import USER_TEMPLATES_DIR
+from opsartisan.config import USER_CACHE_DIR, USER_TEMPLATES_DIR
 from opsartisan.utils.file_utils import copy_directory
+from opsartisan.utils.json_utils import load_json
+
+# Splits git's stderr into segments, keeping each terminator: '\r' ends
+# a progress update, '\n' a log line
+_GIT_OUTPUT_RE = re.compile(rb'(\r|\n)')
 
 
 class TemplateMarketplace:
     """Manages template discovery and installation from remote sources."""
 
+    # Upper bound on templates cloned concurrently by update_many
+    MAX_UPDATE_WORKERS = 8
+
     def __init__(self):
         self.marketplace_url = "https://api.opsartisan.io/templates"
         # For now, use a static catalog
         self.catalog = self._load_catalog()
+        self._by_id = {t['id']: t for t in self.catalog}
+        # Lowercased searchable fields, one per line so a keyword can't
+        # match across two fields
+        self._search_text = [
+            '\n'.join([
+                t.get('id', ''),
+                t.get('title', ''),
+                t.get('description', ''),
+                ' '.join(t.get('tags', []))
+            ]).lower()
+            for t in self.catalog
+        ]
 
     def _load_catalog(self) -> List[Dict[str, Any]]:
         """
@@ -59,40 +82,28 @@ class TemplateMarketplace:
             }
         ]
 
-    def search(self, keyword: str) -> List[Dict[str, Any]]:
+    def search(self, keyword: str) -> Iterator[Dict[str, Any]]:
         """
         Search marketplace templates by keyword.
+
+        Yields copies of the matching catalog entries, flagged with
+        whether they are installed; the catalog itself is left untouched.
         """
         keyword_lower = keyword.lower()
-        results = []
-
-        for template in self.catalog:
-            searchable = [
-                template.get('id', ''),
-                template.get('title', ''),
-                template.get('description', ''),
-                ' '.join(template.get('tags', []))
-            ]
+        installed = None
 
-            if any(keyword_lower in field.lower() for field in searchable):
+        for template, text in zip(self.catalog, self._search_text):
+            if keyword_lower in text:
                 # Check if already installed
-                local_path = USER_TEMPLATES_DIR / template['id']
-                template['installed'] = local_path.exists()
-                results.append(template)
-
-        return results
+                if installed is None:
+                    installed = self._scan_installed()
+                yield {**template, 'installed': template['id'] in installed}
 
     def install_from_marketplace(self, template_id: str) -> str:
         """
         Install a template from the marketplace catalog.
         """
-        # Find template in catalog
-        template_info = None
-        for template in self.catalog:
-            if template['id'] == template_id:
-                template_info = template
-                break
-
+        template_info = self._by_id.get(template_id)
         if not template_info:
             raise ValueError(f"Template '{template_id}' not found in marketplace")
 
@@ -105,7 +116,8 @@ class TemplateMarketplace:
     def install_from_git(
             self,
             git_url: str,
-            custom_name: Optional[str] = None
+            custom_name: Optional[str] = None,
+            progress: bool = True
     ) -> str:
         """
         Clone a template from a git repository.
@@ -113,24 +125,25 @@ class TemplateMarketplace:
         Args:
             git_url: Git repository URL
             custom_name: Optional custom template ID
+            progress: Echo git's clone progress as it arrives
 
         Returns:
             The installed template ID
         """
-        with tempfile.TemporaryDirectory() as temp_dir:
+        # Clone into the cache dir, usually on the same filesystem as the
+        # templates dir so installing is a rename, and where a clone left
+        # by a crash doesn't show up among the templates
+        USER_TEMPLATES_DIR.mkdir(parents=True, exist_ok=True)
+        USER_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        with tempfile.TemporaryDirectory(
+                dir=USER_CACHE_DIR,
+                prefix='clone-'
+        ) as temp_dir:
             temp_path = Path(temp_dir)
 
             # Clone repository
             click.echo(f"Cloning from {git_url}...")
-            try:
-                subprocess.run(
-                    ['git', 'clone', '--depth', '1', git_url, str(temp_path / 'repo')],
-                    check=True,
-                    capture_output=True,
-                    text=True
-                )
-            except subprocess.CalledProcessError as e:
-                raise RuntimeError(f"Failed to clone repository: {e.stderr}")
+            self._clone(git_url, temp_path / 'repo', progress)
 
             repo_path = temp_path / 'repo'
 
@@ -139,14 +152,13 @@ class TemplateMarketplace:
             if not descriptor_path.exists():
                 raise ValueError("No descriptor.json found in repository root")
 
-            with open(descriptor_path) as f:
-                descriptor = json.load(f)
+            descriptor = load_json(descriptor_path)
 
             template_id = custom_name or descriptor.get('id')
             if not template_id:
                 raise ValueError("Template descriptor missing 'id' field")
 
-            # Copy to user templates directory
+            # Move into the user templates directory
             dest_path = USER_TEMPLATES_DIR / template_id
 
             if dest_path.exists():
@@ -156,41 +168,125 @@ class TemplateMarketplace:
                     raise RuntimeError("Installation cancelled")
                 shutil.rmtree(dest_path)
 
-            USER_TEMPLATES_DIR.mkdir(parents=True, exist_ok=True)
-            copy_directory(repo_path, dest_path)
-
             # Remove .git directory
-            git_dir = dest_path / '.git'
+            git_dir = repo_path / '.git'
             if git_dir.exists():
                 shutil.rmtree(git_dir)
 
+            try:
+                os.replace(repo_path, dest_path)
+            except OSError:
+                copy_directory(repo_path, dest_path)
+
             return template_id
 
+    @staticmethod
+    def _clone(git_url: str, dest: Path, progress: bool):
+        """
+        Shallow-clone a repository, streaming git's output instead of buffering it.
+
+        With progress, git's log lines are echoed, and on a terminal its
+        progress updates redraw a single line in place.
+        """
+        show_progress = progress and sys.stdout.isatty()
+
+        # Only the latest tree is needed: no history, branches or tags
+        args = ['git', 'clone']
+        if show_progress:
+            args.append('--progress')
+        args += ['--depth', '1', '--single-branch', '--no-tags', git_url, str(dest)]
+
+        process = subprocess.Popen(
+            args,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.PIPE
+        )
+
+        # Keep only the last log line, or git's error, for failure reports
+        last_line = ''
+        drawn = 0  # Width of the progress line currently on screen
+        buffer = b''
+
+        def handle(segment: bytes, terminator: bytes):
+            nonlocal last_line, drawn
+            text = segment.decode(errors='replace').strip()
+            if not text:
+                return
+            line = f"  {text}"
+            if terminator == b'\r':
+                if show_progress:
+                    click.echo(f"\r{line.ljust(drawn)}", nl=False)
+                    drawn = len(line)
+                return
+            if not last_line.startswith('fatal:'):
+                last_line = text
+            if progress:
+                # A log line replaces the progress line, if one is shown
+                click.echo(f"\r{line.ljust(drawn)}" if drawn else line)
+                drawn = 0
+
+        for chunk in iter(lambda: process.stderr.read1(8192), b''):
+            *parts, buffer = _GIT_OUTPUT_RE.split(buffer + chunk)
+            for segment, terminator in zip(parts[::2], parts[1::2]):
+                handle(segment, terminator)
+        process.stderr.close()
+
+        handle(buffer, b'\n')
+        if drawn:
+            click.echo()
+
+        if process.wait() != 0:
+            raise RuntimeError(f"Failed to clone repository: {last_line}")
+
     def list_installed(self) -> List[str]:
         """
         List all installed templates from marketplace.
         """
-        if not USER_TEMPLATES_DIR.exists():
-            return []
-
-        installed = []
-        for item in USER_TEMPLATES_DIR.iterdir():
-            if item.is_dir() and (item / 'descriptor.json').exists():
-                installed.append(item.name)
+        return [
+            name for name, path in self._scan_installed().items()
+            if os.path.isfile(os.path.join(path, 'descriptor.json'))
+        ]
 
-        return installed
+    @staticmethod
+    def _scan_installed() -> Dict[str, str]:
+        """Map each directory in the user templates dir to its path."""
+        try:
+            with os.scandir(USER_TEMPLATES_DIR) as entries:
+                return {e.name: e.path for e in entries if e.is_dir()}
+        except OSError:
+            return {}
 
     def update(self, template_id: str) -> bool:
         """
         Update an installed template to the latest version.
         """
-        # Find in catalog
-        template_info = None
-        for template in self.catalog:
-            if template['id'] == template_id:
-                template_info = template
-                break
+        return self.update_many([template_id])[0]
 
+    def update_many(self, template_ids: List[str]) -> List[bool]:
+        """
+        Update several installed templates, cloning them concurrently.
+        Returns whether each update succeeded, in the order given.
+        """
+        unique_ids = list(dict.fromkeys(template_ids))
+
+        if len(unique_ids) <= 1:
+            results = [self._update_one(tid) for tid in unique_ids]
+        else:
+            # Concurrent clones' progress lines would interleave
+            with ThreadPoolExecutor(
+                    max_workers=min(self.MAX_UPDATE_WORKERS, len(unique_ids))
+            ) as executor:
+                results = list(executor.map(
+                    lambda tid: self._update_one(tid, progress=False),
+                    unique_ids
+                ))
+
+        succeeded = dict(zip(unique_ids, results))
+        return [succeeded[tid] for tid in template_ids]
+
+    def _update_one(self, template_id: str, progress: bool = True) -> bool:
+        """Replace one installed template with a fresh clone, keeping a backup until it succeeds."""
+        template_info = self._by_id.get(template_id)
         if not template_info:
             click.echo(f"Template '{template_id}' not found in marketplace", err=True)
             return False
@@ -207,7 +303,11 @@ class TemplateMarketplace:
         shutil.move(str(local_path), str(backup_path))
 
         try:
-            self.install_from_git(template_info['git_url'], custom_name=template_id)
+            self.install_from_git(
+                template_info['git_url'],
+                custom_name=template_id,
+                progress=progress
+            )
             click.echo(click.style(f"✓ Updated {template_id}", fg='green'))
 
             # Remove backup on success
@@ -227,7 +327,4 @@ class TemplateMarketplace:
         """
         Get detailed information about a marketplace template.
         """
-        for template in self.catalog:
-            if template['id'] == template_id:
-                return template
-        return None
\ No newline at end of file
+        return self._by_id.get(template_id)
\ No newline at end of file
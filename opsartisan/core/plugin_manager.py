@@ -2,15 +2,39 @@
 
 import importlib.util
 import inspect
+import os
+import re
 from pathlib import Path
-from typing import Dict, Any, List, Callable, Optional, Type
+from typing import Dict, Any, List, Callable, Optional, Tuple
 import click
 from abc import ABC, abstractmethod
 
+from opsartisan.config import (
+    PLUGIN_INDEX_FILE,
+    USER_CACHE_DIR,
+    USER_CONFIG_DIR,
+    USER_TEMPLATES_DIR,
+)
+from opsartisan.utils.json_utils import json_dumps, load_json
+
+# PluginManager registry attributes, one per plugin kind
+_PLUGIN_KINDS = ('validators', 'renderers', 'filters')
+
+# Lines longer than YAMLLintValidator allows
+_LONG_LINE_RE = re.compile(r'^.{121,}$', re.MULTILINE)
+
+# CustomFilters patterns, compiled once rather than per filter call
+_YAML_UNSAFE_RE = re.compile(r'[^a-zA-Z0-9_-]')
+_SLUG_STRIP_RE = re.compile(r'[^\w\s-]')
+_SLUG_DASH_RE = re.compile(r'[-\s]+')
+
 
 class PluginBase(ABC):
     """Base class for all plugins."""
 
+    # Plugins are stateless, so instances need no __dict__
+    __slots__ = ()
+
     @property
     @abstractmethod
     def name(self) -> str:
@@ -27,6 +51,8 @@ class PluginBase(ABC):
 class ValidatorPlugin(PluginBase):
     """Base class for validator plugins."""
 
+    __slots__ = ()
+
     @abstractmethod
     def validate(self, file_path: Path, content: str, context: Dict[str, Any]) -> List[str]:
         """
@@ -46,6 +72,8 @@ class ValidatorPlugin(PluginBase):
 class RendererPlugin(PluginBase):
     """Base class for renderer plugins."""
 
+    __slots__ = ()
+
     @abstractmethod
     def render(self, template_content: str, context: Dict[str, Any]) -> str:
         """
@@ -64,6 +92,8 @@ class RendererPlugin(PluginBase):
 class FilterPlugin(PluginBase):
     """Base class for Jinja2 filter plugins."""
 
+    __slots__ = ()
+
     @abstractmethod
     def get_filters(self) -> Dict[str, Callable]:
         """
@@ -75,6 +105,15 @@ class FilterPlugin(PluginBase):
         pass
 
 
+def _plugin_subclasses(cls: type = PluginBase) -> List[type]:
+    """All subclasses of a plugin class, in definition order."""
+    found = []
+    for subclass in cls.__subclasses__():
+        found.append(subclass)
+        found.extend(_plugin_subclasses(subclass))
+    return list(dict.fromkeys(found))
+
+
 class PluginManager:
     """Manages plugin discovery, loading, and execution."""
 
@@ -83,6 +122,10 @@ class PluginManager:
         self.validators: Dict[str, ValidatorPlugin] = {}
         self.renderers: Dict[str, RendererPlugin] = {}
         self.filters: Dict[str, FilterPlugin] = {}
+        # Plugins known from the index but not imported yet: kind -> name -> file
+        self._pending: Dict[str, Dict[str, Path]] = {
+            kind: {} for kind in _PLUGIN_KINDS
+        }
         self._loaded = False
 
     def add_plugin_dir(self, directory: Path):
@@ -91,77 +134,198 @@ class PluginManager:
             self.plugin_dirs.append(directory)
 
     def discover_plugins(self):
-        """Discover and load all plugins from plugin directories."""
+        """
+        Discover plugins in the plugin directories.
+
+        Files unchanged since they were last indexed are not imported; their
+        plugins are recorded by name and loaded the first time they're used.
+        """
         if self._loaded:
             return
 
+        index = self._load_index()
+        new_index = {}
+
         for plugin_dir in self.plugin_dirs:
-            if not plugin_dir.exists():
+            # One directory read gives names, types and (on Windows) stats
+            try:
+                with os.scandir(plugin_dir) as it:
+                    entries = [
+                        entry for entry in it
+                        if entry.name.endswith('.py')
+                        and not entry.name.startswith(('_', '.'))
+                        and entry.is_file()
+                    ]
+            except OSError:
                 continue
 
-            # Find all Python files
-            for plugin_file in plugin_dir.glob('*.py'):
-                if plugin_file.name.startswith('_'):
+            for entry in entries:
+                plugin_file = Path(entry.path)
+                try:
+                    st = entry.stat()
+                except OSError:
+                    continue
+
+                key = (st.st_mtime_ns, st.st_size)
+                cached = index.get(str(plugin_file))
+                if cached is not None and cached[0] == key:
+                    for kind, name in cached[1]:
+                        self._pending[kind][name] = plugin_file
+                    new_index[str(plugin_file)] = cached
                     continue
 
                 try:
-                    self._load_plugin_file(plugin_file)
+                    provided = self._load_plugin_file(plugin_file)
                 except Exception as e:
                     click.echo(
                         f"Warning: Failed to load plugin {plugin_file.name}: {e}",
                         err=True
                     )
+                    continue
+                new_index[str(plugin_file)] = (key, provided)
+
+        if new_index != index:
+            self._save_index(new_index)
 
         self._loaded = True
 
-    def _load_plugin_file(self, plugin_file: Path):
-        """Load a single plugin file."""
+    def _load_plugin_file(self, plugin_file: Path) -> List[Tuple[str, str]]:
+        """Load a single plugin file; returns the (kind, name) of each plugin in it."""
+        provided = []
+
         # Import the module
         spec = importlib.util.spec_from_file_location(
             f"opsartisan_plugin_{plugin_file.stem}",
             plugin_file
         )
         if spec and spec.loader:
+            known = set(_plugin_subclasses())
             module = importlib.util.module_from_spec(spec)
             spec.loader.exec_module(module)
 
-            # Find plugin classes
-            for name, obj in inspect.getmembers(module, inspect.isclass):
-                if obj in [PluginBase, ValidatorPlugin, RendererPlugin, FilterPlugin]:
+            # Plugin classes the file defined, not ones it merely imported
+            for obj in _plugin_subclasses():
+                if obj in known or inspect.isabstract(obj):
                     continue
 
                 if issubclass(obj, ValidatorPlugin):
                     instance = obj()
                     self.validators[instance.name] = instance
+                    provided.append(('validators', instance.name))
                     click.echo(f"Loaded validator plugin: {instance.name} v{instance.version}")
 
                 elif issubclass(obj, RendererPlugin):
                     instance = obj()
                     self.renderers[instance.name] = instance
+                    provided.append(('renderers', instance.name))
                     click.echo(f"Loaded renderer plugin: {instance.name} v{instance.version}")
 
                 elif issubclass(obj, FilterPlugin):
                     instance = obj()
                     self.filters[instance.name] = instance
+                    provided.append(('filters', instance.name))
                     click.echo(f"Loaded filter plugin: {instance.name} v{instance.version}")
 
-    def get_validator(self, name: str) -> Optional[ValidatorPlugin]:
-        """Get a validator plugin by name."""
+        return provided
+
+    def _load_pending(self, plugin_file: Path):
+        """Import an indexed plugin file that hasn't been loaded yet."""
+        for pending in self._pending.values():
+            for name in [n for n, f in pending.items() if f == plugin_file]:
+                del pending[name]
+
+        try:
+            self._load_plugin_file(plugin_file)
+        except Exception as e:
+            click.echo(
+                f"Warning: Failed to load plugin {plugin_file.name}: {e}",
+                err=True
+            )
+
+    def _get_plugin(self, kind: str, name: str) -> Optional[PluginBase]:
+        """Get a plugin of one kind by name, importing it if only indexed."""
         if not self._loaded:
             self.discover_plugins()
-        return self.validators.get(name)
+
+        registry = getattr(self, kind)
+        if name not in registry and name in self._pending[kind]:
+            self._load_pending(self._pending[kind][name])
+        return registry.get(name)
+
+    @staticmethod
+    def _load_index() -> Dict[str, Tuple[Tuple[int, int], List[Tuple[str, str]]]]:
+        """Load the on-disk plugin index, or an empty one if unusable."""
+        try:
+            return {
+                path: (
+                    (int(stamp[0]), int(stamp[1])),
+                    [(kind, name) for kind, name in provided if kind in _PLUGIN_KINDS]
+                )
+                for path, (stamp, provided) in load_json(PLUGIN_INDEX_FILE).items()
+            }
+        except Exception:
+            return {}
+
+    @staticmethod
+    def _save_index(index: Dict[str, Tuple[Tuple[int, int], List[Tuple[str, str]]]]):
+        """
+        Atomically persist the plugin index.
+
+        Entries are keyed by plugin file path and stamped with its mtime and
+        size. The index is plain JSON, so a tampered cache file can't run
+        code. Failing to write the index is not an error.
+        """
+        import tempfile
+
+        data = json_dumps({
+            path: [list(stamp), [list(plugin) for plugin in provided]]
+            for path, (stamp, provided) in index.items()
+        })
+        try:
+            USER_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+            with tempfile.NamedTemporaryFile(
+                    'wb',
+                    dir=USER_CACHE_DIR,
+                    prefix='.plugins-',
+                    delete=False
+            ) as tmp:
+                tmp.write(data)
+            os.replace(tmp.name, PLUGIN_INDEX_FILE)
+        except OSError:
+            pass
+
+    def get_validator(self, name: str) -> Optional[ValidatorPlugin]:
+        """Get a validator plugin by name."""
+        return self._get_plugin('validators', name)
 
     def get_renderer(self, name: str) -> Optional[RendererPlugin]:
         """Get a renderer plugin by name."""
-        if not self._loaded:
-            self.discover_plugins()
-        return self.renderers.get(name)
+        return self._get_plugin('renderers', name)
+
+    def find(self, name: str) -> Tuple[Optional[str], Optional[PluginBase]]:
+        """
+        Find a plugin of any kind by name.
+        Returns (kind, plugin), where kind is 'validator', 'renderer' or
+        'filters', or (None, None) if no plugin has that name.
+        """
+        for kind, registry_name in (
+                ('validator', 'validators'),
+                ('renderer', 'renderers'),
+                ('filters', 'filters'),
+        ):
+            plugin = self._get_plugin(registry_name, name)
+            if plugin:
+                return kind, plugin
+        return None, None
 
     def get_all_filters(self) -> Dict[str, Callable]:
         """Get all custom Jinja2 filters from plugins."""
         if not self._loaded:
             self.discover_plugins()
 
+        for plugin_file in set(self._pending['filters'].values()):
+            self._load_pending(plugin_file)
+
         all_filters = {}
         for plugin in self.filters.values():
             all_filters.update(plugin.get_filters())
@@ -173,10 +337,13 @@ class PluginManager:
         if not self._loaded:
             self.discover_plugins()
 
+        # Indexed plugins are listed by name without importing them
         return {
-            'validators': list(self.validators.keys()),
-            'renderers': list(self.renderers.keys()),
-            'filters': list(self.filters.keys())
+            kind: list(getattr(self, kind)) + [
+                name for name in self._pending[kind]
+                if name not in getattr(self, kind)
+            ]
+            for kind in _PLUGIN_KINDS
         }
 
     def validate_with_plugin(
@@ -199,6 +366,8 @@ class PluginManager:
 class YAMLLintValidator(ValidatorPlugin):
     """Example validator plugin for YAML files."""
 
+    __slots__ = ()
+
     @property
     def name(self) -> str:
         return "yamllint"
@@ -211,9 +380,12 @@ class YAMLLintValidator(ValidatorPlugin):
         """Validate YAML syntax and style."""
         errors = []
 
+        import yaml
+        # libyaml-backed loader when PyYAML was built with it
+        loader = getattr(yaml, 'CSafeLoader', yaml.SafeLoader)
+
         try:
-            import yaml
-            yaml.safe_load(content)
+            yaml.load(content, Loader=loader)
         except yaml.YAMLError as e:
             errors.append(f"YAML syntax error: {e}")
 
@@ -221,10 +393,12 @@ class YAMLLintValidator(ValidatorPlugin):
         if '\t' in content:
             errors.append("YAML files should use spaces, not tabs")
 
-        # Check line length
-        for i, line in enumerate(content.split('\n'), 1):
-            if len(line) > 120:
-                errors.append(f"Line {i} exceeds 120 characters")
+        # Check line length, counting newlines only up to each long line
+        line_no, pos = 1, 0
+        for match in _LONG_LINE_RE.finditer(content):
+            line_no += content.count('\n', pos, match.start())
+            pos = match.start()
+            errors.append(f"Line {line_no} exceeds 120 characters")
 
         return errors
 
@@ -232,6 +406,8 @@ class YAMLLintValidator(ValidatorPlugin):
 class TomlValidator(ValidatorPlugin):
     """Example validator plugin for TOML files."""
 
+    __slots__ = ()
+
     @property
     def name(self) -> str:
         return "toml"
@@ -245,8 +421,11 @@ class TomlValidator(ValidatorPlugin):
         errors = []
 
         try:
-            import tomli
-            tomli.loads(content)
+            try:
+                import tomllib
+            except ImportError:  # Python < 3.11
+                import tomli as tomllib
+            tomllib.loads(content)
         except Exception as e:
             errors.append(f"TOML syntax error: {e}")
 
@@ -256,6 +435,8 @@ class TomlValidator(ValidatorPlugin):
 class CustomFilters(FilterPlugin):
     """Example filter plugin with custom Jinja2 filters."""
 
+    __slots__ = ()
+
     @property
     def name(self) -> str:
         return "custom_filters"
@@ -281,20 +462,31 @@ class CustomFilters(FilterPlugin):
     @staticmethod
     def _to_yaml_safe(text: str) -> str:
         """Make text safe for YAML keys."""
-        import re
-        return re.sub(r'[^a-zA-Z0-9_-]', '_', text)
+        return _YAML_UNSAFE_RE.sub('_', text)
 
     @staticmethod
     def _base64_encode(text: str) -> str:
         """Base64 encode text."""
-        import base64
-        return base64.b64encode(text.encode()).decode()
+        import binascii
+        # base64 output is pure ASCII, so skip the UTF-8 decoder
+        return binascii.b2a_base64(text.encode(), newline=False).decode('ascii')
 
     @staticmethod
     def _slugify(text: str) -> str:
         """Convert text to URL-friendly slug."""
-        import re
-        text = text.lower()
-        text = re.sub(r'[^\w\s-]', '', text)
-        text = re.sub(r'[-\s]+', '-', text)
-        return text.strip('-')
\ No newline at end of file
+        text = _SLUG_STRIP_RE.sub('', text.lower())
+        return _SLUG_DASH_RE.sub('-', text).strip('-')
+
+
+_default_manager: Optional[PluginManager] = None
+
+
+def get_plugin_manager() -> PluginManager:
+    """Get the PluginManager for the user plugin directories."""
+    global _default_manager
+    if _default_manager is None:
+        _default_manager = PluginManager([
+            USER_CONFIG_DIR / 'plugins',
+            USER_TEMPLATES_DIR / 'plugins'
+        ])
+    return _default_manager
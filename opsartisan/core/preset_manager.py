@@ -1,58 +1,103 @@
 """Preset management for saving and loading configurations."""
 
-import json
-from typing import Dict, Any, Optional
+import copy
+import os
+import tempfile
+from typing import Dict, Any, Optional, Tuple
 
 from opsartisan.config import PRESETS_FILE, USER_CONFIG_DIR
+from opsartisan.utils.file_utils import file_mode
+from opsartisan.utils.json_utils import load_json, json_dumps
 
 
 class PresetManager:
     """Manages saved presets."""
 
-    @staticmethod
-    def load_presets() -> Dict[str, Any]:
-        """Load presets from file."""
-        if not PRESETS_FILE.exists():
-            return {}
+    # Parsed presets file, reused while its (mtime_ns, size) is unchanged
+    _cache: Optional[Dict[str, Any]] = None
+    _cache_key: Optional[Tuple[int, int]] = None
+
+    @classmethod
+    def load_presets(cls) -> Dict[str, Any]:
+        """
+        Load presets from file.
+        Returns a copy, so callers may modify it without touching the cache.
+        """
         try:
-            with open(PRESETS_FILE) as f:
-                return json.load(f)
-        except Exception:
+            st = PRESETS_FILE.stat()
+        except OSError:
             return {}
 
-    @staticmethod
-    def save_preset(name: str, template_id: str, answers: Dict[str, Any]):
+        key = (st.st_mtime_ns, st.st_size)
+        if cls._cache is None or cls._cache_key != key:
+            try:
+                presets = load_json(PRESETS_FILE)
+            except Exception:
+                return {}
+
+            cls._cache = presets
+            cls._cache_key = key
+
+        return copy.deepcopy(cls._cache)
+
+    @classmethod
+    def save_preset(cls, name: str, template_id: str, answers: Dict[str, Any]):
         """Save a preset."""
-        presets = PresetManager.load_presets()
+        presets = cls.load_presets()
         presets[name] = {
             'template_id': template_id,
             'answers': answers
         }
-        USER_CONFIG_DIR.mkdir(parents=True, exist_ok=True)
-        with open(PRESETS_FILE, 'w') as f:
-            json.dump(presets, f, indent=2)
+        cls._write_presets(presets)
 
-    @staticmethod
-    def get_preset(name: str) -> Optional[Dict[str, Any]]:
+    @classmethod
+    def get_preset(cls, name: str) -> Optional[Dict[str, Any]]:
         """Get a specific preset."""
-        presets = PresetManager.load_presets()
+        presets = cls.load_presets()
         return presets.get(name)
 
-    @staticmethod
-    def delete_preset(name: str) -> bool:
+    @classmethod
+    def delete_preset(cls, name: str) -> bool:
         """Delete a preset."""
-        presets = PresetManager.load_presets()
+        presets = cls.load_presets()
         if name not in presets:
             return False
 
         del presets[name]
 
-        with open(PRESETS_FILE, 'w') as f:
-            json.dump(presets, f, indent=2)
+        cls._write_presets(presets)
 
         return True
 
-    @staticmethod
-    def list_presets() -> Dict[str, Any]:
+    @classmethod
+    def list_presets(cls) -> Dict[str, Any]:
         """List all presets with their metadata."""
-        return PresetManager.load_presets()
+        return cls.load_presets()
+
+    @classmethod
+    def _write_presets(cls, presets: Dict[str, Any]):
+        """Atomically replace the presets file and refresh the cache."""
+        USER_CONFIG_DIR.mkdir(parents=True, exist_ok=True)
+
+        # Write to a temp file in the same directory, then swap it in, so an
+        # interrupted write never leaves a truncated presets file
+        with tempfile.NamedTemporaryFile(
+                'wb',
+                dir=USER_CONFIG_DIR,
+                prefix='.presets-',
+                suffix='.tmp',
+                delete=False
+        ) as tmp:
+            tmp.write(json_dumps(presets))
+        try:
+            # The temp file is created 0600; keep the mode the file had
+            os.chmod(tmp.name, file_mode(PRESETS_FILE))
+            os.replace(tmp.name, PRESETS_FILE)
+        except OSError:
+            os.unlink(tmp.name)
+            raise
+
+        st = PRESETS_FILE.stat()
+        # Copied, as the caller still holds presets and the answers in it
+        cls._cache = copy.deepcopy(presets)
+        cls._cache_key = (st.st_mtime_ns, st.st_size)
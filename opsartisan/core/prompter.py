@@ -1,13 +1,11 @@
 """Interactive prompting with questionary or fallback."""
 
+import sys
 from typing import Dict, List, Any
 import click
 
 from opsartisan.config import HAS_QUESTIONARY
 
-if HAS_QUESTIONARY:
-    import questionary
-
 
 class InteractivePrompter:
     """Handles interactive prompts using questionary or fallback."""
@@ -18,6 +16,14 @@ class InteractivePrompter:
         use_defaults: bool = False
     ) -> Dict[str, Any]:
         """Run interactive prompts and return answers."""
+        if use_defaults:
+            return {
+                prompt['id']: prompt.get('default', '') for prompt in prompts
+            }
+
+        if HAS_QUESTIONARY:
+            return InteractivePrompter._prompt_questionary(prompts)
+
         answers = {}
 
         for prompt in prompts:
@@ -27,61 +33,97 @@ class InteractivePrompter:
             default = prompt.get('default', '')
             choices = prompt.get('choices', [])
 
-            if use_defaults:
-                answers[prompt_id] = default
-                continue
-
-            if HAS_QUESTIONARY:
-                if prompt_type == 'text':
-                    answer = questionary.text(
-                        label,
-                        default=str(default)
-                    ).ask()
-                elif prompt_type == 'confirm':
-                    answer = questionary.confirm(
-                        label,
-                        default=bool(default)
-                    ).ask()
-                elif prompt_type == 'select':
-                    answer = questionary.select(
-                        label,
-                        choices=choices,
-                        default=default
-                    ).ask()
-                elif prompt_type == 'number':
-                    answer = questionary.text(
-                        label,
-                        default=str(default)
-                    ).ask()
-                    try:
-                        answer = int(answer)
-                    except ValueError:
-                        answer = default
-                else:
-                    answer = questionary.text(
-                        label,
-                        default=str(default)
-                    ).ask()
+            # Fallback to plain stdin
+            if prompt_type == 'confirm':
+                answer = _stdin_confirm(label, default=bool(default))
+            elif prompt_type == 'select':
+                click.echo(f"{label}")
+                for i, choice in enumerate(choices, 1):
+                    click.echo(f"  {i}. {choice}")
+                choice_idx = _read_line(
+                    f"Select (1-{len(choices)}) [1]: "
+                ) or "1"
+                try:
+                    answer = choices[int(choice_idx) - 1]
+                except (ValueError, IndexError):
+                    answer = choices[0] if choices else default
             else:
-                # Fallback to input()
-                if prompt_type == 'confirm':
-                    answer = input(
-                        f"{label} [y/N]: "
-                    ).lower() in ('y', 'yes')
-                elif prompt_type == 'select':
-                    click.echo(f"{label}")
-                    for i, choice in enumerate(choices, 1):
-                        click.echo(f"  {i}. {choice}")
-                    choice_idx = input(
-                        f"Select (1-{len(choices)}) [1]: "
-                    ) or "1"
-                    try:
-                        answer = choices[int(choice_idx) - 1]
-                    except (ValueError, IndexError):
-                        answer = choices[0] if choices else default
-                else:
-                    answer = input(f"{label} [{default}]: ") or default
+                answer = _read_line(f"{label} [{default}]: ") or default
 
             answers[prompt_id] = answer
 
         return answers
+
+    @staticmethod
+    def _prompt_questionary(prompts: List[Dict[str, Any]]) -> Dict[str, Any]:
+        """Ask all prompts in a single questionary session."""
+        import questionary
+
+        questions = []
+        for prompt in prompts:
+            prompt_id = prompt['id']
+            prompt_type = prompt.get('type', 'text')
+            label = prompt.get('label', prompt_id)
+            default = prompt.get('default', '')
+
+            if prompt_type == 'confirm':
+                question = {'type': 'confirm', 'default': bool(default)}
+            elif prompt_type == 'select':
+                question = {'type': 'select', 'choices': prompt.get('choices', [])}
+                if default:
+                    question['default'] = default
+            else:
+                # 'number' is asked as text and converted afterwards
+                question = {'type': 'text', 'default': str(default)}
+
+            question['name'] = prompt_id
+            question['message'] = label
+            questions.append(question)
+
+        results = questionary.prompt(questions)
+
+        answers = {}
+        for prompt in prompts:
+            prompt_id = prompt['id']
+            answer = results.get(prompt_id)
+
+            if prompt.get('type') == 'number':
+                try:
+                    answer = int(answer)
+                except (TypeError, ValueError):
+                    answer = prompt.get('default', '')
+
+            answers[prompt_id] = answer
+
+        return answers
+
+
+def _read_line(message: str) -> str:
+    """
+    Prompt on stdout and read one line from stdin.
+    Returns '' at end of input, so callers fall back to their default
+    instead of failing on EOFError like input().
+    """
+    sys.stdout.write(message)
+    sys.stdout.flush()
+    return sys.stdin.readline().rstrip('\n')
+
+
+def _questionary_confirm(message: str, default: bool = False) -> bool:
+    """Ask a yes/no question with questionary."""
+    import questionary
+
+    return bool(questionary.confirm(message, default=default).ask())
+
+
+def _stdin_confirm(message: str, default: bool = False) -> bool:
+    """Ask a yes/no question on stdin."""
+    answer = _read_line(f"{message} {'[Y/n]' if default else '[y/N]'}: ").strip()
+    if not answer:
+        return default
+    # Only the first character matters: y/yes/Yep vs n/no/Nope
+    return answer[0] in 'yY'
+
+
+# Yes/no confirmation, bound once to whichever backend is available
+confirm = _questionary_confirm if HAS_QUESTIONARY else _stdin_confirm
@@ -1,25 +1,68 @@
 """Enhanced template discovery, loading, and rendering with merge strategies."""
 
-import json
-import difflib
+import copy
+import itertools
+from collections import Counter
+import os
+import stat
+import tempfile
 from pathlib import Path
-from typing import Dict, List, Any, Optional
-from jinja2 import Environment, FileSystemLoader
+from typing import Dict, List, Any, Optional, Set, Tuple, TYPE_CHECKING
 import click
 
 from opsartisan.config import (
     LOCAL_TEMPLATES_DIR,
     USER_TEMPLATES_DIR,
-    SYSTEM_TEMPLATES_DIR
+    SYSTEM_TEMPLATES_DIR,
+    JINJA_CACHE_DIR,
+    USER_CACHE_DIR,
+    TEMPLATE_INDEX_FILE
 )
+from opsartisan.utils.file_utils import file_mode
+from opsartisan.utils.json_utils import json_dumps, load_json
+
+if TYPE_CHECKING:
+    from jinja2 import BytecodeCache, Environment, Template
+
+
+def _try_load_json(path: str) -> Tuple[Any, Optional[Exception]]:
+    """Load a JSON file, returning (data, None) or (None, error)."""
+    try:
+        return load_json(path), None
+    except Exception as e:
+        return None, e
 
 
 class TemplateManager:
     """Manages template discovery, loading, and rendering with advanced features."""
 
+    # Upper bound on output files rendered concurrently
+    MAX_RENDER_WORKERS = 8
+
+    # Upper bound on descriptor files read concurrently
+    MAX_LOAD_WORKERS = 32
+
+    # Fewer descriptors than this are read inline; a pool costs more
+    MIN_PARALLEL_LOADS = 5
+
+    # Descriptor fields matched by search_templates
+    SEARCH_FIELDS = ('id', 'title', 'description', 'tags')
+
     def __init__(self, plugin_manager=None):
         self.template_dirs = self._discover_template_dirs()
         self.plugin_manager = plugin_manager
+        self._env_cache: Dict[Path, 'Environment'] = {}
+        # (templates dir, output path template) -> compiled path template
+        self._path_cache: Dict[Tuple[Path, str], 'Template'] = {}
+        self._templates_cache: Optional[List[Dict[str, Any]]] = None
+        self._cache_mtimes: Dict[Path, int] = {}
+        self._bytecode_cache: Optional['BytecodeCache'] = None
+        # descriptor.json path -> ((st_mtime_ns, st_size), descriptor)
+        self._index: Optional[Dict[str, Tuple[Tuple[int, int], Dict[str, Any]]]] = None
+        # Lowercased SEARCH_FIELDS of each cached template; None when stale
+        self._search_text: Optional[List[Dict[str, str]]] = None
+        # template id -> descriptor in the templates cache; None when stale
+        self._by_id: Optional[Dict[str, Dict[str, Any]]] = None
 
     def _discover_template_dirs(self) -> List[Path]:
         """Find all template directories."""
@@ -33,54 +76,239 @@ class TemplateManager:
         return dirs
 
     def list_templates(self) -> List[Dict[str, Any]]:
-        """List all available templates with metadata."""
-        templates = []
-        for template_dir in self.template_dirs:
-            if not template_dir.is_dir():
+        """
+        List all available templates with metadata.
+        Returns copies, so callers may modify them without touching the cache.
+        """
+        return copy.deepcopy(self._load_templates())
+
+    def _load_templates(self) -> List[Dict[str, Any]]:
+        """Get the cached template descriptors, rescanning if stale. Read-only."""
+        # One stat per root gives both "is it a directory" and its mtime
+        current_mtimes = {}
+        for d in self.template_dirs:
+            try:
+                st = os.stat(d)
+            except OSError:
                 continue
-            for subdir in template_dir.iterdir():
-                if not subdir.is_dir():
-                    continue
-                descriptor_path = subdir / "descriptor.json"
-                if descriptor_path.exists():
+            if stat.S_ISDIR(st.st_mode):
+                current_mtimes[d] = st.st_mtime_ns
+        if (self._templates_cache is not None
+                and current_mtimes == self._cache_mtimes):
+            return self._templates_cache
+
+        index = self._load_index()
+
+        # Find every descriptor, reusing indexed ones whose stamp matches
+        found = []
+        for template_dir in current_mtimes:
+            with os.scandir(template_dir) as entries:
+                for entry in entries:
+                    # Symlinked template directories are still followed
+                    if not entry.is_dir():
+                        continue
+                    descriptor_path = os.path.join(entry.path, "descriptor.json")
                     try:
-                        with open(descriptor_path) as f:
-                            descriptor = json.load(f)
-                            descriptor['_path'] = subdir
-                            templates.append(descriptor)
-                    except Exception as e:
-                        click.echo(
-                            f"Warning: Failed to load {descriptor_path}: {e}",
-                            err=True
-                        )
+                        st = os.stat(descriptor_path)
+                    except FileNotFoundError:
+                        continue
+
+                    key = (st.st_mtime_ns, st.st_size)
+                    cached = index.get(descriptor_path)
+                    descriptor = cached[1] if cached is not None and cached[0] == key else None
+                    found.append((entry.path, descriptor_path, key, descriptor))
+
+        # Read the rest concurrently; on a cold index that's all of them
+        misses = [descriptor_path for _, descriptor_path, _, d in found if d is None]
+        if len(misses) >= self.MIN_PARALLEL_LOADS:
+            from concurrent.futures import ThreadPoolExecutor
+
+            with ThreadPoolExecutor(
+                    max_workers=min(self.MAX_LOAD_WORKERS, len(misses))
+            ) as executor:
+                loaded = dict(zip(misses, executor.map(_try_load_json, misses)))
+        else:
+            loaded = {path: _try_load_json(path) for path in misses}
+
+        # Keep the entries of roots not scanned this run (e.g. another
+        # working directory's local templates); rescanned roots are rebuilt
+        scanned = {str(d) for d in current_mtimes}
+        new_index = {
+            path: entry for path, entry in index.items()
+            if os.path.dirname(os.path.dirname(path)) not in scanned
+        }
+        templates = []
+        for template_path, descriptor_path, key, descriptor in found:
+            if descriptor is None:
+                descriptor, error = loaded[descriptor_path]
+                if error is not None:
+                    click.echo(
+                        f"Warning: Failed to load {descriptor_path}: {error}",
+                        err=True
+                    )
+                    continue
+            new_index[descriptor_path] = (key, descriptor)
+
+            descriptor = dict(descriptor, _path=Path(template_path))
+            templates.append(descriptor)
+
+        if new_index.keys() != index.keys() or any(
+                index[path][0] != entry[0] for path, entry in new_index.items()
+        ):
+            self._save_index(new_index)
+
+        self._templates_cache = templates
+        self._cache_mtimes = current_mtimes
+        self._search_text = None
+        self._by_id = None
         return templates
 
+    def _load_index(self) -> Dict[str, Tuple[Tuple[int, int], Dict[str, Any]]]:
+        """Load the on-disk descriptor index, or an empty one if unusable."""
+        if self._index is None:
+            try:
+                self._index = {
+                    path: ((int(stamp[0]), int(stamp[1])), descriptor)
+                    for path, (stamp, descriptor) in load_json(TEMPLATE_INDEX_FILE).items()
+                    if isinstance(descriptor, dict)
+                }
+            except Exception:
+                self._index = {}
+        return self._index
+
+    def _save_index(self, index: Dict[str, Tuple[Tuple[int, int], Dict[str, Any]]]):
+        """
+        Atomically persist the descriptor index.
+
+        Entries are keyed by descriptor.json path and stamped with its
+        mtime and size, so later runs only re-parse descriptors that changed.
+        The index is plain JSON, so a tampered cache file can't run code.
+        Failing to write the index is not an error.
+        """
+        self._index = index
+        try:
+            data = json_dumps({
+                path: [list(stamp), descriptor]
+                for path, (stamp, descriptor) in index.items()
+            })
+            USER_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+            with tempfile.NamedTemporaryFile(
+                    'wb',
+                    dir=USER_CACHE_DIR,
+                    prefix='.index-',
+                    delete=False
+            ) as tmp:
+                tmp.write(data)
+            os.replace(tmp.name, TEMPLATE_INDEX_FILE)
+        except (OSError, TypeError, ValueError):
+            pass
+
+    def register_template(self, descriptor: Dict[str, Any], template_path: Path):
+        """
+        Record a freshly installed template in the listing caches.
+
+        The parsed descriptor goes into the on-disk index, so the next run
+        doesn't parse it again, and into this process's template cache if
+        it is loaded, which saves a rescan of every descriptor.
+        """
+        # Kept in the caches, so not shared with the caller
+        descriptor = copy.deepcopy(descriptor)
+
+        descriptor_path = os.path.join(template_path, "descriptor.json")
+        try:
+            st = os.stat(descriptor_path)
+        except OSError:
+            pass
+        else:
+            index = dict(self._load_index())
+            index[descriptor_path] = ((st.st_mtime_ns, st.st_size), descriptor)
+            self._save_index(index)
+
+        parent = template_path.parent
+        if self._templates_cache is None or parent not in self._cache_mtimes:
+            return
+
+        descriptor = dict(descriptor, _path=template_path)
+        self._templates_cache = [
+            t for t in self._templates_cache if t['_path'] != template_path
+        ]
+        self._templates_cache.append(descriptor)
+        self._cache_mtimes[parent] = parent.stat().st_mtime_ns
+        self._search_text = None
+        self._by_id = None
+
+    def invalidate(self):
+        """
+        Drop this process's template listing caches.
+
+        list_templates only notices templates added or removed in the
+        template roots; call this after editing a descriptor in place.
+        Unchanged descriptors are still served from the on-disk index.
+        """
+        self._templates_cache = None
+        self._cache_mtimes = {}
+        self._search_text = None
+        self._by_id = None
+
     def get_template(self, template_id: str) -> Optional[Dict[str, Any]]:
-        """Get a specific template by ID."""
-        for template in self.list_templates():
-            if template.get('id') == template_id:
-                return template
-        return None
-
-    def search_templates(self, keyword: str) -> List[Dict[str, Any]]:
-        """Search templates by keyword in id, title, description, or tags."""
+        """Get a specific template by ID, as a copy."""
+        templates = self._load_templates()
+        if self._by_id is None:
+            by_id = {}
+            for template in templates:
+                # The first template found wins, as in directory priority order
+                by_id.setdefault(template.get('id'), template)
+            self._by_id = by_id
+        return copy.deepcopy(self._by_id.get(template_id))
+
+    def search_templates(
+        self,
+        keyword: str,
+        fields: Tuple[str, ...] = SEARCH_FIELDS
+    ) -> List[Dict[str, Any]]:
+        """
+        Search templates by keyword in id, title, description, or tags.
+        Returns copies of the matching templates.
+        """
         keyword_lower = keyword.lower()
-        templates = self.list_templates()
+        templates = self._load_templates()
+        search_text = self._get_search_text()
 
         results = []
-        for template in templates:
-            # Search in multiple fields
-            searchable = [
-                template.get('id', ''),
-                template.get('title', ''),
-                template.get('description', ''),
-                ' '.join(template.get('tags', []))
-            ]
-
-            if any(keyword_lower in field.lower() for field in searchable):
+        for template, texts in zip(templates, search_text):
+            # Search in multiple fields, using the pre-lowered text
+            if any(
+                keyword_lower in (
+                    texts[field] if field in texts
+                    else self._search_field(template, field).lower()
+                )
+                for field in fields
+            ):
                 results.append(template)
 
-        return results
+        return copy.deepcopy(results)
+
+    @staticmethod
+    def _search_field(template: Dict[str, Any], field: str) -> str:
+        """Get a descriptor field as searchable text."""
+        if field == 'tags':
+            return ' '.join(template.get('tags', []))
+        return template.get(field, '')
+
+    def _get_search_text(self) -> List[Dict[str, str]]:
+        """
+        Get the lowercased SEARCH_FIELDS of each cached template, so
+        queries don't lowercase them again. Rebuilt when the cache changes.
+        """
+        if self._search_text is None:
+            self._search_text = [
+                {
+                    field: self._search_field(template, field).lower()
+                    for field in self.SEARCH_FIELDS
+                }
+                for template in self._templates_cache
+            ]
+        return self._search_text
 
     def render_template(
         self,
@@ -109,50 +337,192 @@ class TemplateManager:
                 f"Templates directory not found: {templates_subdir}"
             )
 
-        # Setup Jinja2 environment with custom filters
-        env = Environment(loader=FileSystemLoader(str(templates_subdir)))
+        env = self._get_env(templates_subdir)
 
-        # Add plugin filters if available
-        if self.plugin_manager:
-            custom_filters = self.plugin_manager.get_all_filters()
-            env.filters.update(custom_filters)
+        # Resolve output paths, in declaration order
+        resolved = [
+            (
+                out_dir / self._render_path(
+                    env, templates_subdir, output['path'], answers
+                ),
+                output['template']
+            )
+            for output in template.get('outputs', [])
+        ]
 
-        created_files = []
+        def render_one(item):
+            output_path, template_file = item
 
-        for output in template.get('outputs', []):
-            # Render output path (supports template variables)
-            output_path_template = env.from_string(output['path'])
-            output_path = out_dir / output_path_template.render(**answers)
+            # Load template
+            jinja_template = env.get_template(template_file)
+
+            # Render straight to disk instead of building the whole string,
+            # into a temp file swapped in once rendering has succeeded, so a
+            # failed render never truncates a file being overwritten
+            stream = jinja_template.stream(**answers)
+            stream.enable_buffering(size=32)
+
+            # Write through a symlink, as opening the path would
+            target = os.path.realpath(output_path)
+            tmp = tempfile.NamedTemporaryFile(
+                'w',
+                encoding='utf-8',
+                dir=os.path.dirname(target),
+                prefix=f'.{output_path.name}.',
+                suffix='.tmp',
+                delete=False
+            )
+            try:
+                with tmp:
+                    stream.dump(tmp)
+                # The temp file is created 0600; give it the usual mode
+                os.chmod(tmp.name, file_mode(target))
+                os.replace(tmp.name, target)
+            except BaseException:
+                os.unlink(tmp.name)
+                raise
+            return output_path
+
+        def render_checked(item):
+            # Settle an existing file, which may have been written by an
+            # earlier output with the same path, then render
+            if not self._prepare_output(item[0], merge_strategy):
+                return None
+            item[0].parent.mkdir(parents=True, exist_ok=True)
+            return render_one(item)
+
+        # Outputs sharing a path (e.g. vhost's nginx/apache variants, as
+        # conditions aren't evaluated here) must be written one after
+        # another, as declared. The others can be written in parallel.
+        path_counts = Counter(output_path for output_path, _ in resolved)
+        independent = [
+            index for index, (output_path, _) in enumerate(resolved)
+            if path_counts[output_path] == 1
+        ]
+
+        if len(independent) <= 1:
+            created_files = [render_checked(item) for item in resolved]
+            return [path for path in created_files if path is not None]
+
+        # Settle existing files for the independent outputs first, on this
+        # thread, since that may prompt
+        independent = [
+            index for index in independent
+            if self._prepare_output(resolved[index][0], merge_strategy)
+        ]
+
+        # Create each parent directory once, shallowest first
+        parents = {resolved[index][0].parent for index in independent}
+        for parent in sorted(parents, key=lambda p: len(p.parts)):
+            parent.mkdir(parents=True, exist_ok=True)
+
+        created = {}
+
+        # Overlap file writes across outputs; results keep declaration order
+        from concurrent.futures import ThreadPoolExecutor
+
+        with ThreadPoolExecutor(
+                max_workers=min(self.MAX_RENDER_WORKERS, max(len(independent), 1))
+        ) as executor:
+            written = executor.map(
+                render_one, [resolved[index] for index in independent]
+            )
 
-            template_file = output['template']
+            # Shared paths are rendered serially here meanwhile, so their
+            # merge prompts stay on this thread
+            for index, item in enumerate(resolved):
+                if path_counts[item[0]] > 1:
+                    created[index] = render_checked(item)
 
-            # Check if file exists and handle merge strategy
-            if output_path.exists():
-                action = self._handle_existing_file(
-                    output_path,
-                    merge_strategy
-                )
+            created.update(zip(independent, written))
 
-                if action == 'skip':
-                    click.echo(f"  Skipped (already exists): {output_path}")
-                    continue
-                elif action == 'backup':
-                    backup_path = output_path.with_suffix(output_path.suffix + '.backup')
-                    output_path.rename(backup_path)
-                    click.echo(f"  Backed up to: {backup_path}")
+        return [
+            created[index] for index in sorted(created)
+            if created[index] is not None
+        ]
 
-            # Load and render template
-            jinja_template = env.get_template(template_file)
-            content = jinja_template.render(**answers)
+    def _prepare_output(self, output_path: Path, merge_strategy: str) -> bool:
+        """
+        Apply the merge strategy to an existing output file.
+
+        Returns:
+            False if the output should be skipped
+        """
+        if not output_path.exists():
+            return True
 
-            # Ensure parent directory exists
-            output_path.parent.mkdir(parents=True, exist_ok=True)
+        action = self._handle_existing_file(output_path, merge_strategy)
 
-            # Write file
-            output_path.write_text(content)
-            created_files.append(output_path)
+        if action == 'skip':
+            click.echo(f"  Skipped (already exists): {output_path}")
+            return False
+        elif action == 'backup':
+            backup_path = output_path.with_suffix(output_path.suffix + '.backup')
+            output_path.rename(backup_path)
+            click.echo(f"  Backed up to: {backup_path}")
 
-        return created_files
+        return True
+
+    def _render_path(
+        self,
+        env: 'Environment',
+        templates_subdir: Path,
+        path: str,
+        answers: Dict[str, Any]
+    ) -> str:
+        """Render an output path, compiling each distinct path template once."""
+        # Plain paths have no Jinja syntax to render
+        if '{' not in path:
+            return path
+
+        key = (templates_subdir, path)
+        path_template = self._path_cache.get(key)
+        if path_template is None:
+            path_template = self._path_cache[key] = env.from_string(path)
+        return path_template.render(**answers)
+
+    def _get_env(self, templates_subdir: Path) -> 'Environment':
+        """Get the cached Jinja2 environment for a templates directory."""
+        env = self._env_cache.get(templates_subdir)
+        if env is None:
+            from jinja2 import Environment, FileSystemLoader
+
+            env = Environment(
+                loader=FileSystemLoader(str(templates_subdir)),
+                bytecode_cache=self._get_bytecode_cache(),
+                auto_reload=False,
+                cache_size=400
+            )
+
+            # Add plugin filters if available
+            if self.plugin_manager:
+                custom_filters = self.plugin_manager.get_all_filters()
+                env.filters.update(custom_filters)
+
+            self._env_cache[templates_subdir] = env
+        return env
+
+    def _get_bytecode_cache(self) -> Optional['BytecodeCache']:
+        """
+        Get the on-disk bytecode cache shared by all environments.
+
+        Compiled templates are kept under JINJA_CACHE_DIR so later runs skip
+        parsing and compiling. Jinja keys each entry by template name and
+        file path and checks the source checksum, so edited templates and
+        templates from different directories never collide. Returns None
+        (no caching) if the directory can't be created.
+        """
+        if self._bytecode_cache is None:
+            from jinja2 import FileSystemBytecodeCache
+
+            try:
+                JINJA_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+            except OSError:
+                return None
+            self._bytecode_cache = FileSystemBytecodeCache(
+                str(JINJA_CACHE_DIR), '%s.cache'
+            )
+        return self._bytecode_cache
 
     def _handle_existing_file(
         self,
@@ -196,13 +566,17 @@ class TemplateManager:
     def _show_diff(self, file_path: Path):
         """Show diff between existing file and what would be generated."""
         try:
-            existing_content = file_path.read_text().splitlines(keepends=True)
+            # Read just the lines shown, plus one to tell if there are more
+            with file_path.open(errors='replace') as f:
+                existing_content = list(itertools.islice(f, 21))
+                size = os.fstat(f.fileno()).st_size
+
             click.echo("\n  Current file content (first 20 lines):")
             for i, line in enumerate(existing_content[:20], 1):
                 click.echo(f"    {i:3d}: {line}", nl=False)
 
             if len(existing_content) > 20:
-                click.echo(f"    ... ({len(existing_content) - 20} more lines)")
+                click.echo(f"    ... (more lines, {size} bytes in total)")
             click.echo()
         except Exception as e:
             click.echo(f"  Could not show diff: {e}")
@@ -248,21 +622,36 @@ class TemplateManager:
         template_path = template.get('_path')
         if template_path:
             templates_dir = template_path / 'templates'
-            if not templates_dir.exists():
+            # One directory read per folder instead of a stat per output
+            try:
+                listings = {'': self._list_names(templates_dir)}
+            except OSError:
                 result['valid'] = False
                 result['errors'].append(f"Templates directory not found: {templates_dir}")
             else:
                 for output in template.get('outputs', []):
-                    template_file = templates_dir / output.get('template', '')
-                    if not template_file.exists():
+                    folder, name = os.path.split(output.get('template', ''))
+                    if folder not in listings:
+                        try:
+                            listings[folder] = self._list_names(templates_dir / folder)
+                        except OSError:
+                            listings[folder] = set()
+                    if name and name not in listings[folder]:
+                        template_file = templates_dir / output['template']
                         result['valid'] = False
                         result['errors'].append(f"Template file not found: {template_file}")
 
         return result
 
+    @staticmethod
+    def _list_names(directory: Path) -> Set[str]:
+        """Get the names of a directory's entries with a single read."""
+        with os.scandir(directory) as entries:
+            return {entry.name for entry in entries}
+
     def get_template_stats(self) -> Dict[str, Any]:
         """Get statistics about available templates."""
-        templates = self.list_templates()
+        templates = self._load_templates()
 
         categories = {}
         tags = {}
@@ -281,4 +670,15 @@ class TemplateManager:
             'categories': categories,
             'tags': tags,
             'template_dirs': [str(d) for d in self.template_dirs]
-        }
\ No newline at end of file
+        }
+
+
+_default_manager: Optional[TemplateManager] = None
+
+
+def get_template_manager() -> TemplateManager:
+    """Get the TemplateManager shared by all commands in this process."""
+    global _default_manager
+    if _default_manager is None:
+        _default_manager = TemplateManager()
+    return _default_manager
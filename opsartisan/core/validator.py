@@ -1,161 +1,229 @@
 """Enhanced validation and testing of generated files with better error messages."""
 
-import subprocess
-import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
 from pathlib import Path
-from typing import Dict, Any, List
+from typing import Dict, Any, Iterable, List, Optional, Tuple
 import click
 
 from opsartisan.utils.validation_utils import ValidationParser, MultiFileValidator, ValidationError
-from opsartisan.utils.async_utils import AsyncValidator
+from opsartisan.utils.process_utils import format_command, split_command
+
+# Pre-styled report lines, filled in with str.format
+_PASSED = click.style("  ✓ {} passed", fg='green')
+_FAILED = click.style("  ✗ {} failed", fg='red')
+
+
+def _read_bytes(path: Path) -> Optional[bytes]:
+    """Read a file, or return None if it can't be read."""
+    try:
+        return path.read_bytes()
+    except OSError:
+        return None
 
 
 class Validator:
     """Handles validation and testing of generated files with enhanced error reporting."""
 
+    # Upper bound on validator/test commands run concurrently
+    MAX_WORKERS = 8
+
+    # Thread pool shared by all runs, created on first use
+    _executor: Optional[ThreadPoolExecutor] = None
+
     @staticmethod
-    def run_validators(template: Dict[str, Any], out_dir: Path, context: Dict[str, Any] = None) -> bool:
+    def _get_executor() -> ThreadPoolExecutor:
+        """Return the shared thread pool, creating it if needed."""
+        if Validator._executor is None:
+            Validator._executor = ThreadPoolExecutor(
+                max_workers=Validator.MAX_WORKERS,
+                thread_name_prefix='validator'
+            )
+        return Validator._executor
+
+    @staticmethod
+    def run_validators(
+        template: Dict[str, Any],
+        out_dir: Path
+    ) -> bool:
         """Run validators for a template with enhanced error messages."""
         validators = template.get('validators', [])
         if not validators:
             click.echo("No validators defined for this template.")
             return True
 
-        all_passed = True
         template_type = template.get('id', '').split('-')[0]  # e.g., 'docker' from 'docker-compose'
 
-        # Multi-file validation context
-        multi_validator = MultiFileValidator()
+        run = partial(
+            Validator._run_single_validator,
+            out_dir=out_dir,
+            template_type=template_type
+        )
 
-        # Add files to context for cross-file validation
-        if context:
-            for key, value in context.items():
-                if isinstance(value, str) and value.endswith(('.yml', '.yaml', '.json')):
-                    file_path = out_dir / value
-                    if file_path.exists():
-                        multi_validator.add_file_context(str(file_path), file_path.read_text())
-
-        for validator in validators:
-            cmd = validator.get('command', '')
-            description = validator.get('description', cmd)
-            file_path = validator.get('file')
-
-            click.echo(f"Running validator: {description}")
-
-            try:
-                result = subprocess.run(
-                    cmd,
-                    shell=True,
-                    cwd=str(out_dir),
-                    capture_output=True,
-                    text=True,
-                    timeout=30
-                )
+        if len(validators) == 1 or not template.get('parallel_validators', True):
+            # One at a time, for validators relying on each other's side effects
+            return Validator._report_results(map(run, validators))
 
-                if result.returncode == 0:
-                    click.echo(
-                        click.style(f"  ✓ {description} passed", fg='green')
-                    )
-                else:
-                    click.echo(
-                        click.style(f"  ✗ {description} failed", fg='red')
-                    )
+        return Validator._report_results(
+            Validator._get_executor().map(run, validators)
+        )
 
-                    # Parse and enhance error messages
-                    if result.stderr:
-                        errors = ValidationParser.parse_error(
-                            result.stderr,
-                            template_type,
-                            file_path
-                        )
-
-                        if errors:
-                            click.echo(click.style("\n  Detailed errors:", fg='yellow'))
-                            for error in errors:
-                                formatted = error.format()
-                                for line in formatted.split('\n'):
-                                    click.echo(f"    {line}")
-                        else:
-                            # Fallback to raw stderr
-                            click.echo(f"    {result.stderr}")
-
-                        # Show quick fixes
-                        quick_fixes = ValidationParser.get_quick_fixes(template_type)
-                        if quick_fixes:
-                            click.echo(click.style("\n  Quick fixes:", fg='cyan'))
-                            for fix in quick_fixes[:3]:  # Show top 3
-                                click.echo(f"    • {fix}")
-
-                    all_passed = False
-
-            except subprocess.TimeoutExpired:
-                click.echo(
-                    click.style(f"  ✗ {description} timed out", fg='red')
-                )
-                click.echo(click.style(
-                    "    💡 Suggestion: Check for infinite loops or increase timeout",
-                    fg='yellow'
-                ))
-                all_passed = False
-            except FileNotFoundError:
-                click.echo(
-                    click.style(f"  ✗ {description} - command not found", fg='red')
-                )
-                # Extract command name
-                cmd_name = cmd.split()[0]
-                click.echo(click.style(
-                    f"    💡 Suggestion: Install '{cmd_name}' or check PATH",
-                    fg='yellow'
-                ))
-                click.echo(f"    📚 Check: https://command-not-found.com/{cmd_name}")
+    @staticmethod
+    def _report_results(results: Iterable[Tuple[bool, List[str]]]) -> bool:
+        """
+        Print each (passed, lines) result as soon as it is ready, in
+        declaration order. Returns True if all of them passed.
+        """
+        all_passed = True
+        for passed, lines in results:
+            click.echo('\n'.join(lines))
+            if not passed:
                 all_passed = False
-            except Exception as e:
-                click.echo(
-                    click.style(f"  ✗ {description} error: {e}", fg='red')
+        return all_passed
+
+    @staticmethod
+    def _run_single_validator(
+        validator: Dict[str, Any],
+        out_dir: Path,
+        template_type: str
+    ) -> Tuple[bool, List[str]]:
+        """Run one validator and collect its report lines."""
+        cmd = validator.get('command', '')
+        description = validator.get('description', format_command(cmd))
+        file_path = validator.get('file')
+
+        lines = [f"Running validator: {description}"]
+
+        import subprocess
+        try:
+            args, use_shell = split_command(cmd)
+            result = subprocess.run(
+                args,
+                shell=use_shell,
+                cwd=str(out_dir),
+                timeout=30,
+                # Only stderr is reported, and only decoded on failure
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.PIPE
+            )
+
+            if result.returncode == 0:
+                lines.append(_PASSED.format(description))
+                return True, lines
+
+            lines.append(_FAILED.format(description))
+
+            # Parse and enhance error messages
+            stderr = result.stderr.decode(errors='replace')
+            if stderr:
+                errors = ValidationParser.parse_error(
+                    stderr,
+                    template_type,
+                    file_path
                 )
-                all_passed = False
 
-        return all_passed
+                if errors:
+                    lines.append(click.style("\n  Detailed errors:", fg='yellow'))
+                    for error in errors:
+                        formatted = error.format()
+                        for line in formatted.split('\n'):
+                            lines.append(f"    {line}")
+                else:
+                    # Fallback to raw stderr
+                    lines.append(f"    {stderr}")
+
+                # Show quick fixes
+                quick_fixes = ValidationParser.get_quick_fixes(template_type)
+                if quick_fixes:
+                    lines.append(click.style("\n  Quick fixes:", fg='cyan'))
+                    for fix in quick_fixes[:3]:  # Show top 3
+                        lines.append(f"    • {fix}")
+
+        except subprocess.TimeoutExpired:
+            lines.append(
+                click.style(f"  ✗ {description} timed out", fg='red')
+            )
+            lines.append(click.style(
+                "    💡 Suggestion: Check for infinite loops or increase timeout",
+                fg='yellow'
+            ))
+        except FileNotFoundError:
+            lines.append(
+                click.style(f"  ✗ {description} - command not found", fg='red')
+            )
+            # Extract command name
+            cmd_name = (cmd if isinstance(cmd, list) else cmd.split())[0]
+            lines.append(click.style(
+                f"    💡 Suggestion: Install '{cmd_name}' or check PATH",
+                fg='yellow'
+            ))
+            lines.append(f"    📚 Check: https://command-not-found.com/{cmd_name}")
+        except Exception as e:
+            lines.append(
+                click.style(f"  ✗ {description} error: {e}", fg='red')
+            )
+
+        return False, lines
 
     @staticmethod
-    def run_validators_async(template: Dict[str, Any], out_dir: Path, context: Dict[str, Any] = None) -> bool:
-        """Run validators in parallel for faster feedback."""
+    def run_validators_async(
+        template: Dict[str, Any],
+        out_dir: Path,
+        fail_fast: bool = False
+    ) -> bool:
+        """
+        Run validators in parallel for faster feedback.
+        With fail_fast, the rest are cancelled once one fails.
+        """
         validators = template.get('validators', [])
         if not validators:
             click.echo("No validators defined for this template.")
             return True
 
-        # Run async validation
-        loop = asyncio.new_event_loop()
-        asyncio.set_event_loop(loop)
+        if not template.get('parallel_validators', True):
+            return Validator.run_validators(template, out_dir)
 
-        try:
-            all_passed, results = loop.run_until_complete(
-                AsyncValidator.run_validators_async(validators, out_dir)
-            )
+        import asyncio
+        from opsartisan.utils.async_utils import AsyncValidator
 
-            # Process results with enhanced error messages
-            template_type = template.get('id', '').split('-')[0]
+        # Can't start a second event loop from inside a running one
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            pass
+        else:
+            return Validator.run_validators(template, out_dir)
 
-            for result in results:
-                if not result['success'] and result.get('error'):
-                    errors = ValidationParser.parse_error(
-                        result['error'],
-                        template_type,
-                        result.get('file')
-                    )
+        # Run async validation
+        all_passed, results = asyncio.run(
+            AsyncValidator.run_validators_async(
+                validators, out_dir, fail_fast=fail_fast
+            )
+        )
+
+        # Process results with enhanced error messages
+        template_type = template.get('id', '').split('-')[0]
+
+        lines = []
+        for result in results:
+            if not result['success'] and result.get('error'):
+                errors = ValidationParser.parse_error(
+                    result['error'],
+                    template_type,
+                    result.get('file')
+                )
 
-                    if errors:
-                        click.echo(click.style("\n  Enhanced error details:", fg='yellow'))
-                        for error in errors:
-                            formatted = error.format()
-                            for line in formatted.split('\n'):
-                                click.echo(f"    {line}")
+                if errors:
+                    lines.append(click.style("\n  Enhanced error details:", fg='yellow'))
+                    for error in errors:
+                        formatted = error.format()
+                        for line in formatted.split('\n'):
+                            lines.append(f"    {line}")
 
-            return all_passed
+        if lines:
+            click.echo('\n'.join(lines))
 
-        finally:
-            loop.close()
+        return all_passed
 
     @staticmethod
     def run_tests(template: Dict[str, Any], out_dir: Path) -> bool:
@@ -165,60 +233,71 @@ class Validator:
             click.echo("No tests defined for this template.")
             return True
 
-        all_passed = True
-        for test in tests:
-            cmd = test.get('command', '')
-            description = test.get('description', cmd)
-
-            click.echo(f"Running test: {description}")
-
-            try:
-                result = subprocess.run(
-                    cmd,
-                    shell=True,
-                    cwd=str(out_dir),
-                    capture_output=True,
-                    text=True,
-                    timeout=60
-                )
+        def run(test):
+            return Validator._run_single_test(test, out_dir)
 
-                if result.returncode == 0:
-                    click.echo(
-                        click.style(f"  ✓ {description} passed", fg='green')
-                    )
-                    if result.stdout:
-                        # Show test output summary
-                        lines = result.stdout.strip().split('\n')
-                        if len(lines) <= 5:
-                            for line in lines:
-                                click.echo(f"    {line}")
-                        else:
-                            click.echo(f"    ... {len(lines)} lines of output")
-                else:
-                    click.echo(
-                        click.style(f"  ✗ {description} failed", fg='red')
-                    )
-                    if result.stderr:
-                        click.echo(f"    {result.stderr}")
-                    elif result.stdout:
-                        click.echo(f"    {result.stdout}")
-                    all_passed = False
-            except subprocess.TimeoutExpired:
-                click.echo(
-                    click.style(f"  ✗ {description} timed out (60s)", fg='red')
-                )
-                click.echo(click.style(
-                    "    💡 Tests taking too long? Consider optimizing or increasing timeout",
-                    fg='yellow'
-                ))
-                all_passed = False
-            except Exception as e:
-                click.echo(
-                    click.style(f"  ✗ {description} error: {e}", fg='red')
-                )
-                all_passed = False
+        if len(tests) == 1 or not template.get('parallel_tests', True):
+            # One at a time, for tests sharing state such as image tags
+            return Validator._report_results(map(run, tests))
 
-        return all_passed
+        return Validator._report_results(
+            Validator._get_executor().map(run, tests)
+        )
+
+    @staticmethod
+    def _run_single_test(
+        test: Dict[str, Any],
+        out_dir: Path
+    ) -> Tuple[bool, List[str]]:
+        """Run one test and collect its report lines."""
+        cmd = test.get('command', '')
+        description = test.get('description', format_command(cmd))
+
+        lines = [f"Running test: {description}"]
+
+        import subprocess
+        try:
+            args, use_shell = split_command(cmd)
+            result = subprocess.run(
+                args,
+                shell=use_shell,
+                cwd=str(out_dir),
+                timeout=60,
+                # Kept as bytes; only the parts shown get decoded
+                capture_output=True
+            )
+
+            if result.returncode == 0:
+                lines.append(_PASSED.format(description))
+                if result.stdout:
+                    # Show test output summary
+                    output_lines = result.stdout.strip().splitlines()
+                    if len(output_lines) <= 5:
+                        for line in output_lines:
+                            lines.append(f"    {line.decode(errors='replace')}")
+                    else:
+                        lines.append(f"    ... {len(output_lines)} lines of output")
+                return True, lines
+
+            lines.append(_FAILED.format(description))
+            if result.stderr:
+                lines.append(f"    {result.stderr.decode(errors='replace')}")
+            elif result.stdout:
+                lines.append(f"    {result.stdout.decode(errors='replace')}")
+        except subprocess.TimeoutExpired:
+            lines.append(
+                click.style(f"  ✗ {description} timed out (60s)", fg='red')
+            )
+            lines.append(click.style(
+                "    💡 Tests taking too long? Consider optimizing or increasing timeout",
+                fg='yellow'
+            ))
+        except Exception as e:
+            lines.append(
+                click.style(f"  ✗ {description} error: {e}", fg='red')
+            )
+
+        return False, lines
 
     @staticmethod
     def validate_multi_file_context(
@@ -260,18 +339,31 @@ class Validator:
         # Kubernetes multi-resource validation
         elif 'kubernetes' in template_type or 'k8s' in template_type:
             import yaml
+            # libyaml-backed loader when PyYAML was built with it
+            loader = getattr(yaml, 'CSafeLoader', yaml.SafeLoader)
             resources = []
 
-            for file in generated_files:
-                if file.suffix in ['.yaml', '.yml']:
-                    try:
-                        with open(file) as f:
-                            docs = yaml.safe_load_all(f)
-                            for doc in docs:
-                                if doc:
-                                    resources.append(doc)
-                    except Exception:
-                        pass
+            yaml_files = [
+                file for file in generated_files
+                if file.suffix in ('.yaml', '.yml')
+            ]
+            if len(yaml_files) > 4:
+                # Overlap reading the manifests; they're parsed in order below
+                contents = list(
+                    Validator._get_executor().map(_read_bytes, yaml_files)
+                )
+            else:
+                contents = [_read_bytes(file) for file in yaml_files]
+
+            for content in contents:
+                if content is None:
+                    continue
+                try:
+                    for doc in yaml.load_all(content, Loader=loader):
+                        if doc:
+                            resources.append(doc)
+                except Exception:
+                    pass
 
             if resources:
                 errors.extend(
@@ -287,30 +379,32 @@ class Validator:
         errors: List[ValidationError] = None
     ):
         """Show a summary of validation results."""
-        click.echo()
+        lines = ['']
 
         if all_passed and not errors:
-            click.echo(click.style("✓ All validations passed!", fg='green', bold=True))
-            click.echo(click.style(
+            lines.append(click.style("✓ All validations passed!", fg='green', bold=True))
+            lines.append(click.style(
                 "  Your generated files are ready to use.",
                 fg='green'
             ))
         else:
-            click.echo(click.style("⚠ Some validations failed", fg='yellow', bold=True))
+            lines.append(click.style("⚠ Some validations failed", fg='yellow', bold=True))
 
             if errors:
-                click.echo(click.style(f"\nFound {len(errors)} issue(s):", fg='yellow'))
+                lines.append(click.style(f"\nFound {len(errors)} issue(s):", fg='yellow'))
                 for error in errors:
                     formatted = error.format()
                     for line in formatted.split('\n'):
-                        click.echo(f"  {line}")
+                        lines.append(f"  {line}")
 
-            click.echo(click.style("\n💡 Tips:", fg='cyan'))
-            click.echo("  • Review the error messages above")
-            click.echo("  • Check the documentation links provided")
-            click.echo("  • Run with --debug for more details")
+            lines.append(click.style("\n💡 Tips:", fg='cyan'))
+            lines.append("  • Review the error messages above")
+            lines.append("  • Check the documentation links provided")
+            lines.append("  • Run with 'opsartisan --debug' for more details")
 
             # Offer to show template info
             template_id = template.get('id')
             if template_id:
-                click.echo(f"  • Run 'opsartisan info {template_id}' for template details")
\ No newline at end of file
+                lines.append(f"  • Run 'opsartisan info {template_id}' for template details")
+
+        click.echo('\n'.join(lines))
\ No newline at end of file
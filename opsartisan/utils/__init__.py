@@ -1,4 +1,32 @@
 """Utility functions for OpsArtisan."""
 
-from opsartisan.utils.file_utils import *
-from opsartisan.utils.template_utils import *
+# Resolved lazily by __getattr__ below, so importing one utils submodule
+# (e.g. completion) doesn't load the others
+_EXPORTS = {
+    "copy_tree": "opsartisan.utils.file_utils",
+    "copy_directory": "opsartisan.utils.file_utils",
+    "ensure_directory": "opsartisan.utils.file_utils",
+    "load_descriptor": "opsartisan.utils.template_utils",
+    "validate_descriptor": "opsartisan.utils.template_utils",
+    "json_loads": "opsartisan.utils.json_utils",
+    "json_dumps": "opsartisan.utils.json_utils",
+    "load_json": "opsartisan.utils.json_utils",
+    "dump_json": "opsartisan.utils.json_utils",
+}
+
+__all__ = list(_EXPORTS)
+
+
+def __getattr__(name):
+    if name in _EXPORTS:
+        import importlib
+
+        obj = getattr(importlib.import_module(_EXPORTS[name]), name)
+        # Cache it so later lookups skip __getattr__ entirely
+        globals()[name] = obj
+        return obj
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return sorted({*globals(), *_EXPORTS})
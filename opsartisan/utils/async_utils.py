@@ -1,11 +1,38 @@
 """Async utilities for parallel validation and operations."""
 
 import asyncio
-import subprocess
+import time
 from pathlib import Path
-from typing import Dict, Any, List, Tuple, Optional
+from typing import Dict, Any, List, Tuple
 import click
-from concurrent.futures import ThreadPoolExecutor, as_completed
+
+from opsartisan.utils.process_utils import format_command, split_command
+
+# Most of a validator's stdout/stderr kept; older output is dropped
+_OUTPUT_TAIL_BYTES = 64 * 1024
+
+
+async def _read_tail(stream: asyncio.StreamReader) -> bytes:
+    """Read a stream to EOF as it arrives, keeping only its last _OUTPUT_TAIL_BYTES."""
+    tail = bytearray()
+    while True:
+        chunk = await stream.read(65536)
+        if not chunk:
+            break
+        tail += chunk
+        if len(tail) > _OUTPUT_TAIL_BYTES:
+            del tail[:-_OUTPUT_TAIL_BYTES]
+    return bytes(tail)
+
+
+async def _drain(proc: asyncio.subprocess.Process) -> Tuple[bytes, bytes]:
+    """Drain both pipes of a process as output arrives, then wait for it to exit."""
+    stdout, stderr, _ = await asyncio.gather(
+        _read_tail(proc.stdout),
+        _read_tail(proc.stderr),
+        proc.wait()
+    )
+    return stdout, stderr
 
 
 class AsyncValidator:
@@ -15,13 +42,17 @@ class AsyncValidator:
     async def run_validators_async(
             validators: List[Dict[str, Any]],
             working_dir: Path,
-            max_workers: int = 4
+            max_workers: int = 4,
+            fail_fast: bool = False
     ) -> Tuple[bool, List[Dict[str, Any]]]:
         """
         Run multiple validators in parallel.
 
+        With fail_fast, the first failure cancels the validators still
+        running or waiting; they're reported as skipped.
+
         Returns:
-            (all_passed, results) tuple
+            (all_passed, results) tuple, with results in validator order
         """
         if not validators:
             return True, []
@@ -31,58 +62,95 @@ class AsyncValidator:
         # Create progress indicator
         total = len(validators)
         completed = 0
+        last_render = None
 
         def update_progress():
-            nonlocal completed
+            nonlocal completed, last_render
             completed += 1
-            click.echo(f"  Progress: {completed}/{total}", nl=False)
-            click.echo('\r', nl=False)
 
-        loop = asyncio.get_event_loop()
+            # Throttled like ProgressIndicator; the final count always shows
+            now = time.monotonic()
+            if (last_render is None
+                    or now - last_render >= ProgressIndicator.MIN_RENDER_INTERVAL
+                    or completed == total):
+                last_render = now
+                click.echo(f"  Progress: {completed}/{total}\r", nl=False)
 
-        # Run validators in thread pool
-        with ThreadPoolExecutor(max_workers=max_workers) as executor:
-            futures = []
+        # Bound how many validator processes run at once
+        semaphore = asyncio.Semaphore(max_workers)
 
-            for validator in validators:
-                future = loop.run_in_executor(
-                    executor,
-                    AsyncValidator._run_single_validator,
+        async def run_one(validator: Dict[str, Any]) -> Dict[str, Any]:
+            async with semaphore:
+                result = await AsyncValidator._run_single_validator(
                     validator,
                     working_dir
                 )
-                futures.append(future)
+            update_progress()
+            return result
+
+        tasks = [
+            asyncio.ensure_future(run_one(validator))
+            for validator in validators
+        ]
+
+        if fail_fast:
+            for next_done in asyncio.as_completed(tasks):
+                if not (await next_done)['success']:
+                    for task in tasks:
+                        task.cancel()
+                    break
+            # Let cancelled validators kill and reap their processes
+            await asyncio.gather(*tasks, return_exceptions=True)
+        else:
+            await asyncio.gather(*tasks)
 
-            # Wait for all to complete
-            results = []
-            for future in asyncio.as_completed(futures):
-                result = await future
-                results.append(result)
-                update_progress()
+        results = [
+            AsyncValidator._skipped_result(validator) if task.cancelled()
+            else task.result()
+            for task, validator in zip(tasks, validators)
+        ]
 
         click.echo()  # New line after progress
 
         # Display results
         all_passed = True
+        lines = []
         for result in results:
             if result['success']:
-                click.echo(click.style(f"  ✓ {result['description']}", fg='green'))
+                lines.append(click.style(f"  ✓ {result['description']}", fg='green'))
+            elif result.get('skipped'):
+                lines.append(click.style(f"  - {result['description']} skipped", fg='yellow'))
+                all_passed = False
             else:
-                click.echo(click.style(f"  ✗ {result['description']}", fg='red'))
+                lines.append(click.style(f"  ✗ {result['description']}", fg='red'))
                 if result.get('error'):
-                    click.echo(f"    {result['error']}")
+                    lines.append(f"    {result['error']}")
                 all_passed = False
+        click.echo('\n'.join(lines))
 
         return all_passed, results
 
     @staticmethod
-    def _run_single_validator(
+    def _skipped_result(validator: Dict[str, Any]) -> Dict[str, Any]:
+        """Result for a validator cancelled by fail_fast."""
+        cmd = validator.get('command', '')
+        return {
+            'description': validator.get('description', format_command(cmd)),
+            'command': cmd,
+            'success': False,
+            'skipped': True,
+            'output': '',
+            'error': ''
+        }
+
+    @staticmethod
+    async def _run_single_validator(
             validator: Dict[str, Any],
             working_dir: Path
     ) -> Dict[str, Any]:
-        """Run a single validator synchronously."""
+        """Run a single validator as an asyncio subprocess."""
         cmd = validator.get('command', '')
-        description = validator.get('description', cmd)
+        description = validator.get('description', format_command(cmd))
         timeout = validator.get('timeout', 30)
 
         result = {
@@ -94,21 +162,43 @@ class AsyncValidator:
         }
 
         try:
-            proc_result = subprocess.run(
-                cmd,
-                shell=True,
-                cwd=str(working_dir),
-                capture_output=True,
-                text=True,
-                timeout=timeout
-            )
+            args, use_shell = split_command(cmd)
+            if use_shell:
+                proc = await asyncio.create_subprocess_shell(
+                    args,
+                    cwd=str(working_dir),
+                    stdout=asyncio.subprocess.PIPE,
+                    stderr=asyncio.subprocess.PIPE
+                )
+            else:
+                proc = await asyncio.create_subprocess_exec(
+                    *args,
+                    cwd=str(working_dir),
+                    stdout=asyncio.subprocess.PIPE,
+                    stderr=asyncio.subprocess.PIPE
+                )
 
-            result['success'] = proc_result.returncode == 0
-            result['output'] = proc_result.stdout
-            result['error'] = proc_result.stderr
+            try:
+                # Drain both pipes as output arrives instead of buffering it all
+                stdout, stderr = await asyncio.wait_for(
+                    _drain(proc),
+                    timeout=timeout
+                )
+            except asyncio.TimeoutError:
+                proc.kill()
+                await proc.wait()
+                result['error'] = f"Timed out after {timeout}s"
+                return result
+            except asyncio.CancelledError:
+                # Cancelled by fail_fast; don't leave the process running
+                proc.kill()
+                await proc.wait()
+                raise
+
+            result['success'] = proc.returncode == 0
+            result['output'] = stdout.decode(errors='replace')
+            result['error'] = stderr.decode(errors='replace')
 
-        except subprocess.TimeoutExpired:
-            result['error'] = f"Timed out after {timeout}s"
         except Exception as e:
             result['error'] = str(e)
 
@@ -118,17 +208,27 @@ class AsyncValidator:
 class ProgressIndicator:
     """Show progress for long-running operations."""
 
+    # Redraw at most this often (seconds); the final frame is always drawn
+    MIN_RENDER_INTERVAL = 1 / 30
+
     def __init__(self, total: int, description: str = "Processing"):
         self.total = total
         self.current = 0
         self.description = description
         self.spinner_chars = ['⠋', '⠙', '⠹', '⠸', '⠼', '⠴', '⠦', '⠧', '⠇', '⠏']
         self.spinner_index = 0
+        self._last_render = None
 
     def update(self, increment: int = 1):
         """Update progress."""
         self.current += increment
-        self._render()
+
+        now = time.monotonic()
+        if (self._last_render is None
+                or now - self._last_render >= self.MIN_RENDER_INTERVAL
+                or self.current >= self.total > 0):
+            self._last_render = now
+            self._render()
 
     def _render(self):
         """Render progress bar."""
@@ -177,19 +277,23 @@ class BatchProcessor:
         Returns:
             List of results
         """
-        results = []
         progress = ProgressIndicator(len(items), description)
 
-        # Process in batches
-        for i in range(0, len(items), batch_size):
-            batch = items[i:i + batch_size]
-            batch_results = await asyncio.gather(
-                *[processor_func(item) for item in batch],
-                return_exceptions=True
-            )
+        # Start the next item as soon as any finishes, rather than waiting
+        # for the slowest item of a fixed batch
+        semaphore = asyncio.Semaphore(batch_size)
+
+        async def run_one(item: Any) -> Any:
+            async with semaphore:
+                try:
+                    return await processor_func(item)
+                finally:
+                    progress.update()
 
-            results.extend(batch_results)
-            progress.update(len(batch))
+        results = await asyncio.gather(
+            *[run_one(item) for item in items],
+            return_exceptions=True
+        )
 
         progress.finish()
-        return results
\ No newline at end of file
+        return list(results)
\ No newline at end of file
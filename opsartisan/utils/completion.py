@@ -1,7 +1,7 @@
 """Shell completion support for bash, zsh, and fish."""
 
+from functools import lru_cache
 from pathlib import Path
-from typing import Optional
 import click
 
 
@@ -11,9 +11,11 @@ class CompletionManager:
     SHELLS = ['bash', 'zsh', 'fish']
 
     @staticmethod
+    @lru_cache(maxsize=8)
     def get_completion_script(shell: str, command_name: str = 'opsartisan') -> str:
         """
         Get the completion script for a specific shell.
+        Scripts are cached, as they only depend on the arguments.
 
         Args:
             shell: Shell type (bash, zsh, fish)
@@ -22,115 +24,16 @@ class CompletionManager:
         Returns:
             Completion script content
         """
-        if shell == 'bash':
-            return CompletionManager._get_bash_script(command_name)
-        elif shell == 'zsh':
-            return CompletionManager._get_zsh_script(command_name)
-        elif shell == 'fish':
-            return CompletionManager._get_fish_script(command_name)
-        else:
-            raise ValueError(f"Unsupported shell: {shell}")
-
-    @staticmethod
-    def _get_bash_script(cmd: str) -> str:
-        """Generate bash completion script."""
-        return f"""# {cmd} bash completion
-_{cmd}_completion() {{
-    local IFS=$'\\n'
-    local response
-
-    response=$(env COMP_WORDS="${{COMP_WORDS[*]}}" \\
-                  COMP_CWORD=$COMP_CWORD \\
-                  _{cmd.upper()}_COMPLETE=bash_complete $1)
-
-    for completion in $response; do
-        IFS=',' read type value <<< "$completion"
-
-        if [[ $type == 'dir' ]]; then
-            COMPREPLY=()
-            compopt -o dirnames
-        elif [[ $type == 'file' ]]; then
-            COMPREPLY=()
-            compopt -o default
-        elif [[ $type == 'plain' ]]; then
-            COMPREPLY+=("$value")
-        fi
-    done
-
-    return 0
-}}
-
-complete -F _{cmd}_completion -o nosort -o bashdefault -o default {cmd}
-"""
-
-    @staticmethod
-    def _get_zsh_script(cmd: str) -> str:
-        """Generate zsh completion script."""
-        return f"""#compdef {cmd}
-
-_{cmd}_completion() {{
-    local -a completions
-    local -a completions_with_descriptions
-    local -a response
-    (( ! $+commands[{cmd}] )) && return 1
-
-    response=("${{(@f)$(env COMP_WORDS="${{words[*]}}" \\
-                       COMP_CWORD=$((CURRENT-1)) \\
-                       _{cmd.upper()}_COMPLETE=zsh_complete {cmd})}}")
-
-    for type value in ${{response[@]}}; do
-        if [[ $type == 'plain' ]]; then
-            if [[ $value == *:* ]]; then
-                completions_with_descriptions+=("$value")
-            else
-                completions+=("$value")
-            fi
-        elif [[ $type == 'dir' ]]; then
-            _path_files -/
-        elif [[ $type == 'file' ]]; then
-            _path_files -f
-        fi
-    done
-
-    if [ -n "$completions_with_descriptions" ]; then
-        _describe -V unsorted completions_with_descriptions -U
-    fi
-
-    if [ -n "$completions" ]; then
-        compadd -U -V unsorted -a completions
-    fi
-}}
-
-if [[ $zsh_eval_context[-1] == loadautofunc ]]; then
-    _{cmd}_completion "$@"
-else
-    compdef _{cmd}_completion {cmd}
-fi
-"""
-
-    @staticmethod
-    def _get_fish_script(cmd: str) -> str:
-        """Generate fish completion script."""
-        return f"""# {cmd} fish completion
-
-function __{cmd}_completion
-    set -l response (env _{cmd.upper()}_COMPLETE=fish_complete COMP_WORDS=(commandline -cp) COMP_CWORD=(commandline -t) {cmd})
+        from click.shell_completion import get_completion_class
+        from opsartisan.cli import cli
 
-    for completion in $response
-        set -l metadata (string split "," -- $completion)
-
-        if test $metadata[1] = "dir"
-            __fish_complete_directories $metadata[2]
-        else if test $metadata[1] = "file"
-            __fish_complete_path $metadata[2]
-        else if test $metadata[1] = "plain"
-            echo $metadata[2]
-        end
-    end
-end
+        comp_cls = get_completion_class(shell)
+        if comp_cls is None:
+            raise ValueError(f"Unsupported shell: {shell}")
 
-complete --no-files --command {cmd} --arguments '(__{cmd}_completion)'
-"""
+        # Click's own script, answered by its _<PROG>_COMPLETE protocol
+        complete_var = f"_{command_name.replace('-', '_').upper()}_COMPLETE"
+        return comp_cls(cli, {}, command_name, complete_var).source()
 
     @staticmethod
     def install_completion(shell: str, command_name: str = 'opsartisan') -> bool:
@@ -188,6 +91,22 @@ complete --no-files --command {cmd} --arguments '(__{cmd}_completion)'
             click.echo(f"Failed to install completion: {e}", err=True)
             return False
 
+    @staticmethod
+    async def install_completion_async(shell: str, command_name: str = 'opsartisan') -> bool:
+        """
+        Install completion from async code without blocking the event loop.
+        The filesystem work runs in the loop's default executor.
+        """
+        import asyncio
+
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            None,
+            CompletionManager.install_completion,
+            shell,
+            command_name
+        )
+
     @staticmethod
     def show_completion_script(shell: str, command_name: str = 'opsartisan'):
         """Print completion script to stdout."""
@@ -200,9 +119,9 @@ complete --no-files --command {cmd} --arguments '(__{cmd}_completion)'
 
 def get_template_ids_for_completion() -> list:
     """Get list of template IDs for completion."""
-    from opsartisan.core.template_manager import TemplateManager
+    from opsartisan.core.template_manager import get_template_manager
 
-    manager = TemplateManager()
+    manager = get_template_manager()
     templates = manager.list_templates()
     return [t['id'] for t in templates]
 
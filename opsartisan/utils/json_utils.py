@@ -0,0 +1,37 @@
+"""JSON helpers that use orjson when it is installed."""
+
+from pathlib import Path
+from typing import Any, Union
+
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    import json
+    HAS_ORJSON = False
+
+
+def json_loads(data: Union[bytes, str]) -> Any:
+    """Parse a JSON document."""
+    if HAS_ORJSON:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def json_dumps(obj: Any) -> bytes:
+    """Serialize an object to indented JSON bytes."""
+    if HAS_ORJSON:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+    return json.dumps(obj, indent=2).encode()
+
+
+def load_json(path: Union[str, Path]) -> Any:
+    """Load a JSON file."""
+    with open(path, 'rb') as f:
+        return json_loads(f.read())
+
+
+def dump_json(obj: Any, path: Union[str, Path]):
+    """Write an object to a file as indented JSON."""
+    with open(path, 'wb') as f:
+        f.write(json_dumps(obj))
@@ -0,0 +1,71 @@
+"""Subprocess helpers for running validator, test and hook commands."""
+
+import os
+import shlex
+from typing import Dict, Iterable, List, Optional, Tuple, Union
+
+
+def split_command(
+        cmd: Union[str, List[str]]
+) -> Tuple[Union[str, List[str]], bool]:
+    """
+    Prepare a command for subprocess.
+
+    Args:
+        cmd: Command string, run through the shell, or an argv list that
+            is run as-is without spawning /bin/sh
+
+    Returns:
+        (args, shell) tuple
+    """
+    if isinstance(cmd, list):
+        return cmd, False
+    return cmd, True
+
+
+def format_command(cmd: Union[str, List[str]]) -> str:
+    """Get a command, string or argv list, as a string for display."""
+    if isinstance(cmd, list):
+        return ' '.join(shlex.quote(str(arg)) for arg in cmd)
+    return cmd
+
+
+def which_all(names: Iterable[str]) -> Dict[str, Optional[str]]:
+    """
+    Locate several executables with a single pass over PATH.
+
+    Returns:
+        Mapping of each name to its full path, or None if not found.
+        Like shutil.which, the first PATH entry holding the name wins.
+    """
+    names = list(dict.fromkeys(names))
+    found: Dict[str, Optional[str]] = dict.fromkeys(names)
+
+    # Paths and Windows PATHEXT lookups are left to shutil.which
+    if os.name == 'nt' or any(os.sep in name for name in names):
+        import shutil
+        return {name: shutil.which(name) for name in names}
+
+    wanted = set(names)
+    for directory in os.environ.get('PATH', os.defpath).split(os.pathsep):
+        if not wanted:
+            break
+        try:
+            entries = os.scandir(directory or os.curdir)
+        except OSError:
+            continue
+        with entries:
+            for entry in entries:
+                if entry.name in wanted and _is_executable(entry):
+                    found[entry.name] = entry.path
+                    wanted.discard(entry.name)
+
+    return found
+
+
+def _is_executable(entry: os.DirEntry) -> bool:
+    """Check that a directory entry is an executable file."""
+    try:
+        return entry.is_file() and os.access(entry.path, os.X_OK)
+    except OSError:
+        return False
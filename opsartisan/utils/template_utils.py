@@ -1,17 +1,19 @@
 """Template-related utility functions."""
 
-import json
 from pathlib import Path
 from typing import Dict, Any
 
+from opsartisan.utils.json_utils import load_json
+
+# Fields every template descriptor must have
+_REQUIRED_FIELDS = frozenset({'id', 'title', 'prompts', 'outputs'})
+
 
 def load_descriptor(path: Path) -> Dict[str, Any]:
     """Load a template descriptor file."""
-    with open(path) as f:
-        return json.load(f)
+    return load_json(path)
 
 
 def validate_descriptor(descriptor: Dict[str, Any]) -> bool:
     """Validate a template descriptor has required fields."""
-    required_fields = ['id', 'title', 'prompts', 'outputs']
-    return all(field in descriptor for field in required_fields)
+    return _REQUIRED_FIELDS <= descriptor.keys()
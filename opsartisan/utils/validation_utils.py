@@ -3,6 +3,12 @@
 import re
 from typing import Dict, Any, List, Optional, Tuple
 
+# 'file:<line>:' location in tool output
+_LINE_NO_RE = re.compile(r':(\d+):')
+
+# '$VAR' / '${VAR}' references in a compose file
+_ENV_REF_RE = re.compile(r'\$\{?([A-Z_][A-Z0-9_]*)\}?')
+
 
 class ValidationError:
     """Represents a validation error with context and suggestions."""
@@ -148,6 +154,35 @@ class ValidationParser:
         ]
     }
 
+    # template type -> (alternation of all its patterns,
+    # [(compiled pattern, pattern info)]), filled on first use
+    _compiled_patterns: Dict[
+        str,
+        Tuple[Optional['re.Pattern'], List[Tuple['re.Pattern', Dict[str, Any]]]]
+    ] = {}
+
+    @staticmethod
+    def _get_patterns(
+        template_type: str
+    ) -> Tuple[Optional['re.Pattern'], List[Tuple['re.Pattern', Dict[str, Any]]]]:
+        """
+        Get a template type's ERROR_PATTERNS with their regexes compiled,
+        plus one regex matching wherever any of them does (None if there
+        are no patterns).
+        """
+        compiled = ValidationParser._compiled_patterns.get(template_type)
+        if compiled is None:
+            pattern_infos = ValidationParser.ERROR_PATTERNS.get(template_type, [])
+            any_pattern = re.compile('|'.join(
+                f"(?:{pattern_info['pattern']})" for pattern_info in pattern_infos
+            )) if pattern_infos else None
+            compiled = (any_pattern, [
+                (re.compile(pattern_info['pattern']), pattern_info)
+                for pattern_info in pattern_infos
+            ])
+            ValidationParser._compiled_patterns[template_type] = compiled
+        return compiled
+
     @staticmethod
     def parse_error(
         error_output: str,
@@ -158,41 +193,47 @@ class ValidationParser:
         Parse validation error output and create enhanced error objects.
         """
         errors = []
-        patterns = ValidationParser.ERROR_PATTERNS.get(template_type, [])
+        any_pattern, patterns = ValidationParser._get_patterns(template_type)
 
-        for line in error_output.split('\n'):
-            if not line.strip():
+        for line in error_output.splitlines():
+            message = line.strip()
+            if not message:
                 continue
 
-            # Try to match known patterns
+            # Try to match known patterns. Most lines match none, which one
+            # search of the combined regex settles; the rest find the first
+            # pattern that matches, in declaration order.
             matched = False
-            for pattern_info in patterns:
-                match = re.search(pattern_info['pattern'], line)
-                if match:
-                    suggestion = pattern_info['suggestion']
-                    if callable(suggestion):
-                        suggestion = suggestion(match)
-
-                    # Try to extract line number
-                    line_match = re.search(r':(\d+):', line)
-                    line_number = int(line_match.group(1)) if line_match else None
+            if any_pattern is not None and any_pattern.search(line):
+                for regex, pattern_info in patterns:
+                    match = regex.search(line)
+                    if match:
+                        suggestion = pattern_info['suggestion']
+                        if callable(suggestion):
+                            suggestion = suggestion(match)
+
+                        # Try to extract line number
+                        line_match = _LINE_NO_RE.search(line)
+                        line_number = int(line_match.group(1)) if line_match else None
+
+                        errors.append(ValidationError(
+                            message=message,
+                            file_path=file_path,
+                            line_number=line_number,
+                            suggestion=suggestion,
+                            doc_link=pattern_info.get('doc_link')
+                        ))
+                        matched = True
+                        break
 
+            # If no pattern matched, create basic error
+            if not matched:
+                line_lower = line.lower()
+                if 'error' in line_lower or 'failed' in line_lower:
                     errors.append(ValidationError(
-                        message=line.strip(),
-                        file_path=file_path,
-                        line_number=line_number,
-                        suggestion=suggestion,
-                        doc_link=pattern_info.get('doc_link')
+                        message=message,
+                        file_path=file_path
                     ))
-                    matched = True
-                    break
-
-            # If no pattern matched, create basic error
-            if not matched and ('error' in line.lower() or 'failed' in line.lower()):
-                errors.append(ValidationError(
-                    message=line.strip(),
-                    file_path=file_path
-                ))
 
         return errors
 
@@ -262,20 +303,19 @@ class MultiFileValidator:
         """
         errors = []
 
-        # Extract environment variable references
-        env_refs = re.findall(r'\$\{?([A-Z_][A-Z0-9_]*)\}?', compose_content)
+        # Extract environment variable references, deduplicated in order
+        env_refs = list(dict.fromkeys(_ENV_REF_RE.findall(compose_content)))
 
         if env_content:
             # Parse .env file
-            defined_vars = set()
-            for line in env_content.split('\n'):
-                line = line.strip()
-                if line and not line.startswith('#'):
-                    var_name = line.split('=')[0].strip()
-                    defined_vars.add(var_name)
+            defined_vars = {
+                line.split('=', 1)[0].strip()
+                for line in map(str.strip, env_content.split('\n'))
+                if line and not line.startswith('#')
+            }
 
             # Check for undefined variables
-            for var in set(env_refs):
+            for var in env_refs:
                 if var not in defined_vars:
                     errors.append(ValidationError(
                         message=f"Environment variable ${var} is not defined in .env",
@@ -287,7 +327,7 @@ class MultiFileValidator:
         elif env_refs:
             # .env file missing but variables referenced
             errors.append(ValidationError(
-                message=f"Environment variables referenced but no .env file found: {', '.join(set(env_refs))}",
+                message=f"Environment variables referenced but no .env file found: {', '.join(env_refs)}",
                 suggestion='Create a .env file with required variables',
                 doc_link='https://docs.docker.com/compose/environment-variables/'
             ))
@@ -303,10 +343,13 @@ class MultiFileValidator:
         Checks cross-resource references like Services -> Deployments.
         """
         errors = []
-        deployments = {}
+        # Per Deployment, extracted from its pod template in the one pass
+        # over the resources: its labels, and its containers' envFrom sources
+        deployment_labels = {}
+        deployment_env_from = {}
         services = {}
-        config_maps = {}
-        secrets = {}
+        config_maps = set()
+        secrets = set()
 
         # Catalog resources
         for resource in resources:
@@ -315,26 +358,33 @@ class MultiFileValidator:
             name = metadata.get('name')
 
             if kind == 'Deployment':
-                deployments[name] = resource
+                pod_template = resource.get('spec', {}).get('template', {})
+                deployment_labels[name] = (
+                    pod_template.get('metadata', {}).get('labels') or {}
+                )
+                containers = pod_template.get('spec', {}).get('containers') or []
+                deployment_env_from[name] = [
+                    env_source
+                    for container in containers
+                    for env_source in container.get('envFrom') or []
+                ]
             elif kind == 'Service':
                 services[name] = resource
             elif kind == 'ConfigMap':
-                config_maps[name] = resource
+                config_maps.add(name)
             elif kind == 'Secret':
-                secrets[name] = resource
+                secrets.add(name)
 
         # Validate Service -> Deployment references
         for svc_name, service in services.items():
             spec = service.get('spec', {})
             selector = spec.get('selector', {})
 
-            # Check if any deployment matches the selector
-            matched = False
-            for dep_name, deployment in deployments.items():
-                dep_labels = deployment.get('spec', {}).get('template', {}).get('metadata', {}).get('labels', {})
-                if all(dep_labels.get(k) == v for k, v in selector.items()):
-                    matched = True
-                    break
+            # Check if any deployment's labels include the selector
+            matched = any(
+                selector.items() <= dep_labels.items()
+                for dep_labels in deployment_labels.values()
+            )
 
             if not matched and selector:
                 errors.append(ValidationError(
@@ -345,31 +395,26 @@ class MultiFileValidator:
                 ))
 
         # Validate ConfigMap/Secret references in Deployments
-        for dep_name, deployment in deployments.items():
-            containers = deployment.get('spec', {}).get('template', {}).get('spec', {}).get('containers', [])
-
-            for container in containers:
-                # Check envFrom references
-                env_from = container.get('envFrom', [])
-                for env_source in env_from:
-                    if 'configMapRef' in env_source:
-                        cm_name = env_source['configMapRef'].get('name')
-                        if cm_name and cm_name not in config_maps:
-                            errors.append(ValidationError(
-                                message=f"Deployment '{dep_name}' references missing ConfigMap '{cm_name}'",
-                                file_path=f'{dep_name}-deployment.yaml',
-                                suggestion=f"Create ConfigMap '{cm_name}' or check the reference",
-                                doc_link='https://kubernetes.io/docs/concepts/configuration/configmap/'
-                            ))
-
-                    if 'secretRef' in env_source:
-                        secret_name = env_source['secretRef'].get('name')
-                        if secret_name and secret_name not in secrets:
-                            errors.append(ValidationError(
-                                message=f"Deployment '{dep_name}' references missing Secret '{secret_name}'",
-                                file_path=f'{dep_name}-deployment.yaml',
-                                suggestion=f"Create Secret '{secret_name}' or check the reference",
-                                doc_link='https://kubernetes.io/docs/concepts/configuration/secret/'
-                            ))
+        for dep_name, env_from in deployment_env_from.items():
+            for env_source in env_from:
+                if 'configMapRef' in env_source:
+                    cm_name = env_source['configMapRef'].get('name')
+                    if cm_name and cm_name not in config_maps:
+                        errors.append(ValidationError(
+                            message=f"Deployment '{dep_name}' references missing ConfigMap '{cm_name}'",
+                            file_path=f'{dep_name}-deployment.yaml',
+                            suggestion=f"Create ConfigMap '{cm_name}' or check the reference",
+                            doc_link='https://kubernetes.io/docs/concepts/configuration/configmap/'
+                        ))
+
+                if 'secretRef' in env_source:
+                    secret_name = env_source['secretRef'].get('name')
+                    if secret_name and secret_name not in secrets:
+                        errors.append(ValidationError(
+                            message=f"Deployment '{dep_name}' references missing Secret '{secret_name}'",
+                            file_path=f'{dep_name}-deployment.yaml',
+                            suggestion=f"Create Secret '{secret_name}' or check the reference",
+                            doc_link='https://kubernetes.io/docs/concepts/configuration/secret/'
+                        ))
 
         return errors
\ No newline at end of file
@@ -0,0 +1,8 @@
+"""Shared test setup."""
+
+import os
+import tempfile
+
+# opsartisan.config resolves its user directories at import time, so point
+# HOME at a scratch directory before any test imports the package
+os.environ['HOME'] = tempfile.mkdtemp(prefix='opsartisan-test-home-')
@@ -0,0 +1,55 @@
+"""Tests for file helpers."""
+
+import os
+import shutil
+
+from click.testing import CliRunner
+
+from opsartisan.commands.add_template import add_template
+from opsartisan.config import USER_TEMPLATES_DIR
+from opsartisan.utils.file_utils import copy_directory
+
+
+def _make_source(tmp_path):
+    source = tmp_path / 'source'
+    (source / 'templates').mkdir(parents=True)
+    (source / 'descriptor.json').write_text('{"id": "linked-or-not"}')
+    (source / 'templates' / 'a.j2').write_text('original')
+    return source
+
+
+def test_copy_directory_copies_by_default(tmp_path):
+    source = _make_source(tmp_path)
+    dest = tmp_path / 'dest'
+
+    copy_directory(source, dest)
+
+    copied = dest / 'templates' / 'a.j2'
+    assert copied.read_text() == 'original'
+    assert not os.path.samefile(copied, source / 'templates' / 'a.j2')
+
+
+def test_copy_directory_hardlinks_on_request(tmp_path):
+    source = _make_source(tmp_path)
+    dest = tmp_path / 'dest'
+
+    copy_directory(source, dest, hardlink=True)
+
+    assert os.path.samefile(dest / 'templates' / 'a.j2', source / 'templates' / 'a.j2')
+
+
+def test_add_template_copies_unless_linked(tmp_path):
+    source = _make_source(tmp_path)
+    installed = USER_TEMPLATES_DIR / 'linked-or-not' / 'templates' / 'a.j2'
+    runner = CliRunner()
+
+    result = runner.invoke(add_template, [str(source)])
+    assert result.exit_code == 0, result.output
+    (source / 'templates' / 'a.j2').write_text('edited')
+    assert installed.read_text() == 'original'
+
+    shutil.rmtree(USER_TEMPLATES_DIR / 'linked-or-not')
+    result = runner.invoke(add_template, [str(source), '--link'])
+    assert result.exit_code == 0, result.output
+    if os.stat(source).st_dev == os.stat(USER_TEMPLATES_DIR).st_dev:
+        assert os.path.samefile(installed, source / 'templates' / 'a.j2')
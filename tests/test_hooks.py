@@ -0,0 +1,30 @@
+"""Tests for hook execution."""
+
+import pytest
+
+from opsartisan.core.hooks import HookExecutor
+
+
+@pytest.mark.parametrize('command, passed', [
+    ('exit 0', True),
+    ('exit 1', False),
+    ('command -v sh', True),
+    ('test -d .', True),
+    ('true # trailing comment', True),
+    ('if true; then echo yes > out.txt; fi', True),
+])
+def test_shell_hooks_run_through_the_shell(tmp_path, command, passed):
+    hooks = [{'type': 'shell', 'command': command, 'on_failure': 'fail'}]
+
+    assert HookExecutor.execute_hooks(hooks, tmp_path, {}) is passed
+
+
+def test_shell_hook_comment_is_not_passed_as_arguments(tmp_path):
+    hooks = [{
+        'type': 'shell',
+        'command': 'printf "%s," {{name}} > args.txt # not an argument',
+        'on_failure': 'fail'
+    }]
+
+    assert HookExecutor.execute_hooks(hooks, tmp_path, {'name': 'app'})
+    assert (tmp_path / 'args.txt').read_text() == 'app,'
@@ -0,0 +1,18 @@
+"""Tests for the new command."""
+
+from click.testing import CliRunner
+
+from opsartisan.cli import cli
+
+
+def test_debug_accepted_after_subcommand():
+    result = CliRunner().invoke(cli, ['new', 'no-such-template', '--debug'])
+
+    assert 'No such option' not in result.output
+    assert result.exit_code == 1
+
+
+def test_debug_hidden_from_new_help():
+    result = CliRunner().invoke(cli, ['new', '--help'])
+
+    assert '--debug' not in result.output
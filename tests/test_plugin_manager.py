@@ -0,0 +1,49 @@
+"""Tests for plugin discovery and the plugin index."""
+
+from opsartisan.config import PLUGIN_INDEX_FILE
+from opsartisan.core.plugin_manager import PluginManager
+from opsartisan.utils.json_utils import load_json
+
+PLUGIN_SOURCE = '''
+from opsartisan.core.plugin_manager import ValidatorPlugin
+
+
+class WordCountValidator(ValidatorPlugin):
+    @property
+    def name(self):
+        return "{name}"
+
+    @property
+    def version(self):
+        return "1.0"
+
+    def validate(self, file_path, content, context):
+        return []
+'''
+
+
+def test_indexed_plugin_is_loaded_on_first_use(tmp_path):
+    plugin_file = tmp_path / 'wordcount.py'
+    plugin_file.write_text(PLUGIN_SOURCE.format(name='wordcount'))
+
+    PluginManager([tmp_path]).discover_plugins()
+
+    index = load_json(PLUGIN_INDEX_FILE)
+    assert index[str(plugin_file)][1] == [['validators', 'wordcount']]
+
+    # A second run finds the plugin through the index, without importing it
+    manager = PluginManager([tmp_path])
+    manager.discover_plugins()
+    assert 'wordcount' not in manager.validators
+    assert manager.get_validator('wordcount').name == 'wordcount'
+
+
+def test_unreadable_index_is_ignored(tmp_path):
+    (tmp_path / 'other.py').write_text(PLUGIN_SOURCE.format(name='other'))
+    PLUGIN_INDEX_FILE.parent.mkdir(parents=True, exist_ok=True)
+    PLUGIN_INDEX_FILE.write_bytes(b'\x80\x05not json')
+
+    manager = PluginManager([tmp_path])
+
+    assert manager.get_validator('other').name == 'other'
+    assert isinstance(load_json(PLUGIN_INDEX_FILE), dict)
@@ -0,0 +1,43 @@
+"""Tests for subprocess helpers."""
+
+import subprocess
+
+import pytest
+
+from opsartisan.utils.process_utils import format_command, split_command
+
+
+@pytest.mark.parametrize('command', [
+    'kubeval deployment.yaml',
+    'exit 1',
+    'command -v docker',
+    'type kubectl',
+    'true',
+    'test -f x',
+    'umask',
+    'if true; then echo ok; fi',
+    'time ls',
+    'kubeval x.yaml # lint',
+])
+def test_command_strings_use_the_shell(command):
+    assert split_command(command) == (command, True)
+
+
+def test_argv_lists_run_directly():
+    argv = ['kubeval', 'deployment.yaml']
+
+    assert split_command(argv) == (argv, False)
+
+
+def test_trailing_comment_is_not_an_argument(tmp_path):
+    args, shell = split_command('printf "%s," a b # c d')
+    result = subprocess.run(
+        args, shell=shell, cwd=str(tmp_path), capture_output=True, text=True
+    )
+
+    assert result.stdout == 'a,b,'
+
+
+def test_format_command_quotes_argv():
+    assert format_command(['echo', 'two words']) == "echo 'two words'"
+    assert format_command('echo hi') == 'echo hi'
@@ -0,0 +1,165 @@
+"""Tests for template rendering and listing."""
+
+import json
+from pathlib import Path
+
+import pytest
+from jinja2 import UndefinedError
+
+from opsartisan.config import TEMPLATE_INDEX_FILE
+from opsartisan.core.template_manager import TemplateManager
+from opsartisan.utils.json_utils import load_json
+
+
+def _make_template(root: Path, files: dict, outputs: list) -> dict:
+    """Create a template directory with the given Jinja files."""
+    templates_dir = root / 'tmpl' / 'templates'
+    templates_dir.mkdir(parents=True)
+    for name, content in files.items():
+        (templates_dir / name).write_text(content)
+    return {'id': 'tmpl', '_path': root / 'tmpl', 'outputs': outputs}
+
+
+def test_render_writes_outputs(tmp_path):
+    template = _make_template(
+        tmp_path,
+        {'a.j2': 'name={{ name }}\n'},
+        [{'path': '{{ name }}.txt', 'template': 'a.j2'}]
+    )
+    out_dir = tmp_path / 'out'
+
+    created = TemplateManager().render_template(template, {'name': 'x'}, out_dir)
+
+    assert created == [out_dir / 'x.txt']
+    assert (out_dir / 'x.txt').read_text() == 'name=x'
+
+
+def test_failed_overwrite_keeps_existing_file(tmp_path):
+    template = _make_template(
+        tmp_path,
+        {'a.j2': 'start {{ a.b.c }}\n'},
+        [{'path': 'config.txt', 'template': 'a.j2'}]
+    )
+    out_dir = tmp_path / 'out'
+    out_dir.mkdir()
+    existing = out_dir / 'config.txt'
+    existing.write_text('user data\n')
+    existing.chmod(0o640)
+
+    with pytest.raises(UndefinedError):
+        TemplateManager().render_template(
+            template, {}, out_dir, merge_strategy='overwrite'
+        )
+
+    assert existing.read_text() == 'user data\n'
+    # No temp file is left behind either
+    assert [p.name for p in out_dir.iterdir()] == ['config.txt']
+
+
+def test_overwrite_keeps_file_mode(tmp_path):
+    template = _make_template(
+        tmp_path,
+        {'a.j2': 'new\n'},
+        [{'path': 'run.sh', 'template': 'a.j2'}]
+    )
+    out_dir = tmp_path / 'out'
+    out_dir.mkdir()
+    existing = out_dir / 'run.sh'
+    existing.write_text('old\n')
+    existing.chmod(0o750)
+
+    TemplateManager().render_template(
+        template, {}, out_dir, merge_strategy='overwrite'
+    )
+
+    assert existing.read_text() == 'new'
+    assert existing.stat().st_mode & 0o777 == 0o750
+
+
+def test_outputs_sharing_a_path_respect_skip(tmp_path):
+    template = _make_template(
+        tmp_path,
+        {'first.j2': 'first\n', 'second.j2': 'second\n', 'other.j2': 'other\n'},
+        [
+            {'path': 'site.conf', 'template': 'first.j2'},
+            {'path': 'site.conf', 'template': 'second.j2'},
+            {'path': 'a.txt', 'template': 'other.j2'},
+            {'path': 'b.txt', 'template': 'other.j2'},
+        ]
+    )
+    out_dir = tmp_path / 'out'
+
+    TemplateManager().render_template(
+        template, {}, out_dir, merge_strategy='skip'
+    )
+
+    assert (out_dir / 'site.conf').read_text() == 'first'
+
+
+def _write_descriptor(root: Path, template_id: str, title: str) -> Path:
+    template_dir = root / template_id
+    template_dir.mkdir(parents=True, exist_ok=True)
+    path = template_dir / 'descriptor.json'
+    path.write_text(json.dumps({'id': template_id, 'title': title}))
+    return path
+
+
+def _manager(*roots: Path) -> TemplateManager:
+    manager = TemplateManager()
+    manager.template_dirs = list(roots)
+    return manager
+
+
+def test_index_picks_up_edited_descriptor(tmp_path):
+    root = tmp_path / 'templates'
+    descriptor = _write_descriptor(root, 'web', 'Old')
+    assert _manager(root).get_template('web')['title'] == 'Old'
+
+    descriptor.write_text(json.dumps({'id': 'web', 'title': 'New title'}))
+
+    assert _manager(root).get_template('web')['title'] == 'New title'
+
+
+def test_index_keeps_entries_of_other_roots(tmp_path):
+    first = tmp_path / 'first'
+    second = tmp_path / 'second'
+    first_descriptor = _write_descriptor(first, 'one', 'One')
+    _write_descriptor(second, 'two', 'Two')
+
+    _manager(first).list_templates()
+    _manager(second).list_templates()
+
+    index = load_json(TEMPLATE_INDEX_FILE)
+    assert str(first_descriptor) in index
+
+
+def test_index_is_json_and_ignores_unreadable_files(tmp_path):
+    root = tmp_path / 'templates'
+    _write_descriptor(root, 'web', 'Web')
+    TEMPLATE_INDEX_FILE.parent.mkdir(parents=True, exist_ok=True)
+    TEMPLATE_INDEX_FILE.write_bytes(b'\x80\x05not json')
+
+    assert _manager(root).get_template('web')['title'] == 'Web'
+    assert isinstance(load_json(TEMPLATE_INDEX_FILE), dict)
+
+
+def test_returned_descriptors_are_copies(tmp_path):
+    root = tmp_path / 'templates'
+    _write_descriptor(root, 'web', 'Web')
+    manager = _manager(root)
+
+    manager.get_template('web')['title'] = 'Changed'
+    manager.list_templates()[0]['title'] = 'Changed'
+
+    assert manager.get_template('web')['title'] == 'Web'
+
+
+def test_search_matches_substrings_of_any_field(tmp_path):
+    root = tmp_path / 'templates'
+    _write_descriptor(root, 'docker-compose', 'Compose stack')
+    _write_descriptor(root, 'systemd', 'Unit file')
+    manager = _manager(root)
+
+    assert [t['id'] for t in manager.search_templates('ocker')] == ['docker-compose']
+    assert [t['id'] for t in manager.search_templates('UNIT')] == ['systemd']
+    assert [t['id'] for t in manager.search_templates('stack', fields=('id',))] == []
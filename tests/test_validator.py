@@ -0,0 +1,41 @@
+"""Tests for running template validators and tests."""
+
+from opsartisan.core.validator import Validator
+
+
+def test_validators_run_shell_builtins(tmp_path):
+    template = {
+        'id': 'example',
+        'validators': [
+            {'command': 'command -v sh'},
+            {'command': 'test -d . # comment'},
+        ]
+    }
+
+    assert Validator.run_validators(template, tmp_path)
+
+
+def test_validator_argv_list_runs_without_shell(tmp_path):
+    (tmp_path / 'a b.txt').write_text('x')
+    template = {
+        'id': 'example',
+        'validators': [{'command': ['test', '-f', 'a b.txt']}]
+    }
+
+    assert Validator.run_validators(template, tmp_path)
+
+
+def test_failing_test_is_reported(tmp_path):
+    template = {'id': 'example', 'tests': [{'command': 'exit 3'}]}
+
+    assert not Validator.run_tests(template, tmp_path)
+
+
+def test_async_validators_fall_back_when_not_parallel(tmp_path):
+    template = {
+        'id': 'example',
+        'parallel_validators': False,
+        'validators': [{'command': 'true'}, {'command': 'exit 1'}]
+    }
+
+    assert not Validator.run_validators_async(template, tmp_path)